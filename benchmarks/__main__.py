@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+from benchmarks import harness
+import benchmarks.bench_bulk
+import benchmarks.bench_domain
+import benchmarks.bench_shopping_list
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument('-k', '--pattern', default='*', help='run only benchmarks matching this glob')
+    parser.add_argument('-o', '--output', type=Path, help='write results as JSON to this file')
+    parser.add_argument('-b', '--baseline', type=Path, help='JSON results to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=0.2,
+                        help='fail if a benchmark is slower than the baseline by more than this fraction')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    results = harness.run(args.pattern, args.repeat)
+    baseline = harness.load(args.baseline) if args.baseline else None
+    print(harness.format_results(results, baseline))
+    if args.output:
+        harness.save(results, args.output)
+    if baseline:
+        regressions = harness.compare(harness.to_json(results)['benchmarks'], baseline, args.threshold)
+        for name, ratio in sorted(regressions.items()):
+            print(f'REGRESSION {name}: {ratio:.2f}x slower than baseline', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
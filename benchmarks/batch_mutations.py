@@ -0,0 +1,61 @@
+import argparse
+import time
+from typing import Any, Dict, List
+
+import requests
+
+from benchmarks.server import StandInServer
+
+USERNAME = 'benchmarkUser1'
+PASSWORD = 'benchMark1!'
+
+
+def items(count: int) -> List[Dict[str, Any]]:
+    return [{'name': f'Item {index}', 'category': 'Smartphone', 'manufacturer': 'Samsung', 'price': 10000 + index,
+             'quantity': 1, 'description': ''} for index in range(count)]
+
+
+def per_item(url: str, headers: Dict[str, str], count: int) -> float:
+    start = time.perf_counter()
+    ids = [requests.post(url=f'{url}shopping-list/add/', headers=headers, data=item).json()['id']
+           for item in items(count)]
+    for item_id in ids:
+        requests.patch(url=f'{url}shopping-list/edit/{item_id}', headers=headers, data={'quantity': 2})
+    for item_id in ids:
+        requests.delete(url=f'{url}shopping-list/edit/{item_id}', headers=headers)
+    return time.perf_counter() - start
+
+
+def batched(url: str, headers: Dict[str, str], count: int) -> float:
+    start = time.perf_counter()
+    results = requests.post(url=f'{url}shopping-list/batch/', headers=headers,
+                            json=[{'op': 'add', 'item': item} for item in items(count)]).json()
+    ids = [result['body']['id'] for result in results]
+    requests.post(url=f'{url}shopping-list/batch/', headers=headers,
+                  json=[{'op': 'edit', 'id': item_id, 'item': {'quantity': 2}} for item_id in ids])
+    requests.post(url=f'{url}shopping-list/batch/', headers=headers,
+                  json=[{'op': 'delete', 'id': item_id} for item_id in ids])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.batch_mutations')
+    parser.add_argument('--items', type=int, default=9)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--latency', type=float, default=0.005, help='server side latency in seconds')
+    args = parser.parse_args()
+
+    with StandInServer(latency=args.latency) as server:
+        server.add_user(USERNAME, PASSWORD)
+        key = requests.post(url=f'{server.url}auth/login/', data={'username': USERNAME, 'password': PASSWORD}).json()
+        headers = {'Authorization': f"Token {key['key']}"}
+        single = min(per_item(server.url, headers, args.items) for _ in range(args.runs))
+        batch = min(batched(server.url, headers, args.items) for _ in range(args.runs))
+
+    print(f'{args.items} adds + edits + deletes, latency {args.latency * 1000:.1f}ms, best of {args.runs}')
+    print(f'per item: {single * 1000:8.2f}ms ({3 * args.items} requests)')
+    print(f'batched:  {batch * 1000:8.2f}ms (3 requests, {single / batch:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+from valid8 import ValidationError
+
+from benchmarks.harness import benchmark
+from shopping_list.bulk import validate_columns, build_items
+from shopping_list.domain import Name, Manufacturer, Price, Quantity, Description
+
+ROWS = 1000
+
+
+def build_columns(rows: int) -> list:
+    return [
+        ['Smartphone' if row % 2 else 'Computer' for row in range(rows)],
+        [f'Item {row}' if row % 10 else '<script>' for row in range(rows)],
+        [('Samsung', 'Apple', 'Xiaomi')[row % 3] for row in range(rows)],
+        [row * 100 for row in range(rows)],
+        [row % 6 for row in range(rows)],
+        ['Caratteristiche: CPU,GPU,Chipset' for _ in range(rows)],
+    ]
+
+
+@benchmark(f'bulk.validate_columns[{ROWS}]')
+def bulk_validate_columns():
+    columns = build_columns(ROWS)
+    return lambda: validate_columns(*columns)
+
+
+@benchmark(f'bulk.build_items[{ROWS}]')
+def bulk_build_items():
+    columns = build_columns(ROWS)
+    return lambda: build_items(*columns)
+
+
+@benchmark(f'bulk.per_row_objects[{ROWS}]')
+def per_row_objects():
+    rows = list(zip(*build_columns(ROWS)))
+
+    def run():
+        for _, name, manufacturer, price, quantity, description in rows:
+            try:
+                Name(name), Manufacturer(manufacturer), Price.from_cents(price), Quantity(quantity), \
+                    Description(description)
+            except ValidationError:
+                pass
+
+    return run
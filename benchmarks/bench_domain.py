@@ -0,0 +1,50 @@
+from benchmarks.harness import benchmark
+from shopping_list.domain import Name, Manufacturer, Quantity, Price, Description, Username, Email, Password, \
+    Smartphone, Computer
+
+
+def _constructor(cls, value):
+    return lambda: lambda: cls(value)
+
+
+for _cls, _value in [(Name, 'Galaxy S20 Plus'), (Manufacturer, 'Samsung'), (Quantity, 3),
+                     (Description, 'Caratteristiche: CPU,GPU,Chipset'), (Username, 'MarioRossi'),
+                     (Email, 'mario.rossi@libero.it'), (Password, 'marioRossi17?')]:
+    benchmark(f'domain.{_cls.__name__}')(_constructor(_cls, _value))
+
+
+@benchmark('domain.Price.create')
+def price_create():
+    return lambda: Price.create(1099, 99)
+
+
+@benchmark('domain.Price.parse')
+def price_parse():
+    return lambda: Price.parse('1099.99')
+
+
+@benchmark('domain.Price.add')
+def price_add():
+    a, b = Price.create(10, 50), Price.create(5, 75)
+    return lambda: a.add(b)
+
+
+def _item_fields():
+    return Name('Galaxy S20'), Manufacturer('Samsung'), Price.create(999), Quantity(1), Description('')
+
+
+@benchmark('domain.Smartphone')
+def smartphone():
+    fields = _item_fields()
+    return lambda: Smartphone(*fields)
+
+
+@benchmark('domain.Computer')
+def computer():
+    fields = _item_fields()
+    return lambda: Computer(*fields)
+
+
+for _cls, _value in [(Name, 'Galaxy S20 Plus'), (Manufacturer, 'Samsung'), (Quantity, 3),
+                     (Description, 'Caratteristiche: CPU,GPU,Chipset')]:
+    benchmark(f'domain.{_cls.__name__}.of')(_constructor(_cls.of, _value))
@@ -0,0 +1,51 @@
+from benchmarks.harness import benchmark
+from shopping_list.domain import ShoppingList, Smartphone, Computer, Name, Manufacturer, Price, Quantity, Description
+
+SIZES = (1, 5, 10)
+
+
+def build_items(size: int) -> list:
+    return [(Smartphone if i % 2 else Computer)(Name(f'Item {i}'), Manufacturer(f'Maker {chr(65 + size - i)}'),
+                                                Price.create(100 * (size - i)), Quantity(1), Description(''))
+            for i in range(size)]
+
+
+def build_shopping_list(items: list) -> ShoppingList:
+    shopping_list = ShoppingList()
+    for item in items:
+        if item.category == 'Smartphone':
+            shopping_list.add_smartphone(item)
+        else:
+            shopping_list.add_computer(item)
+    return shopping_list
+
+
+def _register(size: int) -> None:
+    items = build_items(size)
+
+    @benchmark(f'shopping_list.add[{size}]')
+    def add():
+        return lambda: build_shopping_list(items)
+
+    @benchmark(f'shopping_list.remove[{size}]')
+    def remove():
+        def run():
+            shopping_list = build_shopping_list(items)
+            while shopping_list.items():
+                shopping_list.remove_item(shopping_list.items() - 1)
+
+        return run
+
+    @benchmark(f'shopping_list.sort_by_price[{size}]')
+    def sort_by_price():
+        shopping_list = build_shopping_list(items)
+        return shopping_list.sort_by_price
+
+    @benchmark(f'shopping_list.sort_by_manufacturer[{size}]')
+    def sort_by_manufacturer():
+        shopping_list = build_shopping_list(items)
+        return shopping_list.sort_by_manufacturer
+
+
+for _size in SIZES:
+    _register(_size)
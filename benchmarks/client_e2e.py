@@ -0,0 +1,108 @@
+import argparse
+import os
+import re
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import requests.api
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+import shopping_list.app
+from benchmarks.server import StandInServer
+from shopping_list import token_cache
+from shopping_list.app import App
+
+USERNAME = 'benchmarkUser1'
+PASSWORD = 'benchMark1!'
+
+_id_in_path = re.compile(r'/\d+/?$')
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))]
+
+
+def session_input(items: int, mutations: int) -> List[str]:
+    lines = ['1', USERNAME, PASSWORD]
+    for mutation in range(mutations):
+        step = mutation % 3
+        if step == 0:
+            lines += ['4', str(mutation % items + 1), str(mutation % 5 + 1)]
+        elif step == 1:
+            lines += ['1', f'Bench {mutation}', 'Benchmark', '1', '9.99', '']
+        else:
+            lines += ['3', str(items + 1)]
+    return lines + ['0', '0']
+
+
+def seed(server: StandInServer, items: int) -> None:
+    server.add_user(USERNAME, PASSWORD)
+    for index in range(items):
+        server.add_item(USERNAME, {'name': f'Item {index}', 'category': 'Smartphone', 'manufacturer': 'Samsung',
+                                   'price': 10000 + index, 'quantity': 1, 'description': ''})
+
+
+def run(sessions: int, items: int, mutations: int, latency: float, jitter: float, error_rate: float) -> None:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[int, int] = defaultdict(int)
+    original_request = requests.api.request
+
+    def timed_request(method, url, **kwargs):
+        start = time.perf_counter()
+        try:
+            response = original_request(method, url, **kwargs)
+        except requests.RequestException:
+            statuses[0] += 1
+            raise
+        endpoint = f"{method.upper()} {_id_in_path.sub('/{id}', url.split('/api/v1/', 1)[-1])}"
+        latencies[endpoint].append(time.perf_counter() - start)
+        statuses[response.status_code] += 1
+        return response
+
+    with StandInServer(latency=latency, jitter=jitter, error_rate=error_rate, seed=0) as server, \
+            tempfile.TemporaryDirectory() as directory, \
+            patch.dict(os.environ, {token_cache.PATH_VARIABLE: str(Path(directory) / 'token')}):
+        seed(server, items)
+        start = time.perf_counter()
+        with patch.object(shopping_list.app, 'api_server', server.url), \
+                patch('requests.api.request', side_effect=timed_request), \
+                patch('builtins.print'):
+            for _ in range(sessions):
+                token_cache.clear()
+                with patch('builtins.input', side_effect=session_input(items, mutations)):
+                    App().run()
+        elapsed = time.perf_counter() - start
+
+    every = [value for values in latencies.values() for value in values]
+    print(f'{sessions} sessions, {items} items, {mutations} mutations per session, '
+          f'latency {latency * 1000:.1f}ms, error rate {error_rate:.0%}')
+    print(f"{'ENDPOINT':<32} {'COUNT':>6} {'P50 ms':>9} {'P95 ms':>9} {'P99 ms':>9}")
+    for endpoint, values in sorted(latencies.items()) + [('ALL', every)]:
+        if values:
+            print(f'{endpoint:<32} {len(values):>6} {percentile(values, 0.50) * 1000:>9.2f} '
+                  f'{percentile(values, 0.95) * 1000:>9.2f} {percentile(values, 0.99) * 1000:>9.2f}')
+    print(f'{len(every) / elapsed:.1f} requests/s over {elapsed:.2f}s')
+    print('status codes: ' + ', '.join(f'{status}={count}' for status, count in sorted(statuses.items())))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.client_e2e')
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--items', type=int, default=9, choices=range(1, 10), metavar='N (1-9)',
+                        help='items stored on the server; one slot is kept free for the add mutations')
+    parser.add_argument('--mutations', type=int, default=9)
+    parser.add_argument('--latency', type=float, default=0.0, help='server side latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 500')
+    args = parser.parse_args()
+    run(args.sessions, args.items, args.mutations, args.latency, args.jitter, args.error_rate)
+
+
+if __name__ == '__main__':
+    main()
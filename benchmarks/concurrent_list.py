@@ -0,0 +1,97 @@
+import argparse
+import os
+import threading
+import time
+from typing import Any, Callable, List, Tuple
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+from benchmarks.bench_shopping_list import build_items
+from shopping_list.concurrent_list import ConcurrentShoppingList
+from shopping_list.domain import ShoppingList, Quantity
+
+
+def read_snapshot(shopping_list: ConcurrentShoppingList) -> Callable[[], Any]:
+    def read():
+        snapshot = shopping_list.snapshot()
+        return sum(1 for _ in snapshot), snapshot.total()
+
+    return read
+
+
+def write_snapshot(shopping_list: ConcurrentShoppingList) -> Callable[[int], None]:
+    return lambda step: shopping_list.change_quantity(step % shopping_list.items(), Quantity(1 + step % 5))
+
+
+def read_locked(shopping_list: ShoppingList, lock: threading.Lock) -> Callable[[], Any]:
+    def read():
+        with lock:
+            return sum(1 for _ in shopping_list), shopping_list.total()
+
+    return read
+
+
+def write_locked(shopping_list: ShoppingList, lock: threading.Lock) -> Callable[[int], None]:
+    def write(step):
+        with lock:
+            shopping_list.change_quantity(step % shopping_list.items(), Quantity(1 + step % 5))
+
+    return write
+
+
+def measure(read: Callable[[], Any], write: Callable[[int], None], readers: int, writers: int,
+            seconds: float) -> Tuple[int, int]:
+    stop = threading.Event()
+    reads: List[int] = []
+    writes: List[int] = []
+
+    def reader():
+        done = 0
+        while not stop.is_set():
+            read()
+            done += 1
+        reads.append(done)
+
+    def writer():
+        done = 0
+        while not stop.is_set():
+            write(done)
+            done += 1
+        writes.append(done)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + \
+              [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads), sum(writes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.concurrent_list')
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    items = build_items(10)
+    concurrent = ConcurrentShoppingList()
+    with concurrent.transaction() as inner:
+        for item in items:
+            (inner.add_smartphone if item.category == 'Smartphone' else inner.add_computer)(item)
+    locked, lock = ShoppingList(), threading.Lock()
+    for item in items:
+        (locked.add_smartphone if item.category == 'Smartphone' else locked.add_computer)(item)
+
+    print(f'{args.readers} readers, {args.writers} writers, {args.seconds:.1f}s, 10 items')
+    for name, read, write in (('single lock', read_locked(locked, lock), write_locked(locked, lock)),
+                              ('snapshots', read_snapshot(concurrent), write_snapshot(concurrent))):
+        reads, writes = measure(read, write, args.readers, args.writers, args.seconds)
+        print(f'{name:12} {reads / args.seconds:12,.0f} reads/s {writes / args.seconds:10,.0f} writes/s')
+
+
+if __name__ == '__main__':
+    main()
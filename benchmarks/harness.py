@@ -0,0 +1,76 @@
+import fnmatch
+import json
+import platform
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+_registry: Dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    seconds_per_call: float
+    calls: int
+
+
+def benchmark(name: str) -> Callable:
+    def register(setup: Callable[[], Callable[[], object]]) -> Callable[[], Callable[[], object]]:
+        if name in _registry:
+            raise ValueError(f'Duplicated benchmark: {name}')
+        _registry[name] = setup
+        return setup
+
+    return register
+
+
+def registered() -> List[str]:
+    return sorted(_registry)
+
+
+def run(pattern: str = '*', repeat: int = 5) -> List[Result]:
+    results = []
+    for name in registered():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        timer = timeit.Timer(_registry[name]())
+        calls, _ = timer.autorange()
+        best = min(timer.repeat(repeat=repeat, number=calls))
+        results.append(Result(name, best / calls, calls))
+    return results
+
+
+def to_json(results: List[Result]) -> dict:
+    return {
+        'python': platform.python_version(),
+        'benchmarks': {result.name: result.seconds_per_call for result in results},
+    }
+
+
+def save(results: List[Result], path: Path) -> None:
+    path.write_text(json.dumps(to_json(results), indent=2, sort_keys=True) + '\n')
+
+
+def load(path: Path) -> Dict[str, float]:
+    return json.loads(path.read_text())['benchmarks']
+
+
+def compare(current: Dict[str, float], baseline: Dict[str, float], threshold: float) -> Dict[str, float]:
+    regressions = {}
+    for name, seconds in current.items():
+        previous = baseline.get(name)
+        if previous and seconds / previous > 1 + threshold:
+            regressions[name] = seconds / previous
+    return regressions
+
+
+def format_results(results: List[Result], baseline: Optional[Dict[str, float]] = None) -> str:
+    lines = []
+    for result in results:
+        line = f'{result.name:<45} {result.seconds_per_call * 1e6:>12.3f} us/call'
+        if baseline and baseline.get(result.name):
+            line += f' {result.seconds_per_call / baseline[result.name]:>8.2f}x'
+        lines.append(line)
+    return '\n'.join(lines)
@@ -0,0 +1,29 @@
+import os
+import random
+import timeit
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+from shopping_list.domain import ShoppingList, Smartphone, Name, Manufacturer, Price, Quantity, Description
+
+CALLS = 1_000_000
+
+
+def build_shopping_list(size: int = 10) -> ShoppingList:
+    shopping_list = ShoppingList()
+    for i in range(size):
+        shopping_list.add_smartphone(Smartphone(Name(f'Phone {i}'), Manufacturer('Samsung'), Price.create(100 + i),
+                                                Quantity(1), Description('')))
+    return shopping_list
+
+
+def main() -> None:
+    shopping_list = build_shopping_list()
+    indexes = [random.randrange(shopping_list.items()) for _ in range(CALLS)]
+    item = shopping_list.item
+    elapsed = timeit.timeit(lambda: [item(index) for index in indexes], number=1)
+    print(f'{CALLS} random item() calls: {elapsed:.3f}s ({elapsed / CALLS * 1e9:.0f} ns/call)')
+
+
+if __name__ == '__main__':
+    main()
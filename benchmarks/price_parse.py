@@ -0,0 +1,32 @@
+import os
+import random
+import time
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+from shopping_list.domain import Price
+
+VALUES = 1_000_000
+
+
+def main() -> None:
+    values = [f'{random.randrange(1000)}.{random.randrange(100):02}' for _ in range(VALUES)]
+
+    start = time.perf_counter()
+    prices = [Price.parse(value) for value in values]
+    total = prices[0]
+    for price in prices[1:]:
+        total = total.add(price)
+    objects = time.perf_counter() - start
+    print(f'Price.parse + Price.add on {VALUES} strings: {objects:.3f}s ({objects / VALUES * 1e9:.0f} ns/value)')
+
+    start = time.perf_counter()
+    fast_total = Price.sum_cents(Price.parse_cents(values))
+    fast = time.perf_counter() - start
+    assert fast_total == total
+    print(f'Price.parse_cents + Price.sum_cents on {VALUES} strings: {fast:.3f}s '
+          f'({fast / VALUES * 1e9:.0f} ns/value, {objects / fast:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
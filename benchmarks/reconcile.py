@@ -0,0 +1,65 @@
+import argparse
+import os
+import random
+import time
+from dataclasses import replace
+from typing import Any, List
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+from shopping_list.domain import Smartphone, Computer, Name, Manufacturer, Price, Quantity, Description
+from shopping_list.reconcile import by_key, diff, merge
+
+MANUFACTURERS = ('Apple', 'Google', 'Samsung', 'Xiaomi', 'Dell', 'Lenovo')
+
+
+def items(count: int) -> List[Any]:
+    description = Description('')
+    quantity = Quantity(1)
+    manufacturers = [Manufacturer(value) for value in MANUFACTURERS]
+    return [(Smartphone if index % 2 else Computer)(Name(f'Item {index}'), manufacturers[index % len(manufacturers)],
+                                                    Price.from_cents(index % 100000), quantity, description)
+            for index in range(count)]
+
+
+def diverge(base: List[Any], rng: random.Random, offset: int, changes: int) -> List[Any]:
+    result = list(base)
+    for index in rng.sample(range(len(result)), changes):
+        result[index] = replace(result[index], quantity=Quantity(rng.randint(2, 5)))
+    del result[offset:offset + changes]
+    return result + items(len(base) + offset + changes)[len(base) + offset:]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.reconcile')
+    parser.add_argument('--items', type=int, default=1_000_000)
+    parser.add_argument('--changes', type=int, default=10_000, help='edits, deletes and adds on each side')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    start = time.perf_counter()
+    base = items(args.items)
+    local = diverge(base, rng, 0, args.changes)
+    remote = diverge(base, rng, args.changes, args.changes)
+    print(f'built 3 lists of ~{args.items} items in {time.perf_counter() - start:.2f}s')
+
+    start = time.perf_counter()
+    changes = diff(base, local)
+    print(f'diff:  {time.perf_counter() - start:.2f}s ({len(changes.added)} added, {len(changes.edited)} edited, '
+          f'{len(changes.deleted)} deleted)')
+
+    start = time.perf_counter()
+    indexed = [by_key(items) for items in (base, local, remote)]
+    print(f'index: {time.perf_counter() - start:.2f}s')
+
+    start = time.perf_counter()
+    merged = merge(base, local, remote)
+    print(f'merge: {time.perf_counter() - start:.2f}s ({len(merged.items)} items, {len(merged.conflicts)} conflicts)')
+
+    start = time.perf_counter()
+    to_server = diff(indexed[2], by_key(merged.items))
+    print(f'diff to server: {time.perf_counter() - start:.2f}s ({len(to_server)} operations)')
+
+
+if __name__ == '__main__':
+    main()
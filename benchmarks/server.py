@@ -0,0 +1,200 @@
+import gzip
+import hashlib
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+_edit_path = re.compile(r'shopping-list/edit/(?P<id>\d+)/?')
+
+
+class StandInServer:
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__users: Dict[str, Tuple[str, str]] = {}
+        self.__tokens: Dict[str, str] = {}
+        self.__items: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self.__next_id = 1
+        self.__server: Optional[ThreadingHTTPServer] = None
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f'http://{host}:{port}/api/v1/'
+
+    def start(self) -> 'StandInServer':
+        self.__server = ThreadingHTTPServer(('127.0.0.1', 0), self.__handler())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+    def __enter__(self) -> 'StandInServer':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def add_user(self, username: str, password: str, email: str = '') -> None:
+        with self.__lock:
+            self.__users[username] = (email, password)
+            self.__items.setdefault(username, {})
+
+    def add_item(self, username: str, item: Dict[str, Any]) -> int:
+        with self.__lock:
+            item_id = self.__next_id
+            self.__next_id += 1
+            self.__items[username][item_id] = {**item, 'id': item_id}
+            return item_id
+
+    def items(self, username: str) -> List[Dict[str, Any]]:
+        with self.__lock:
+            return [dict(item) for item in self.__items[username].values()]
+
+    def handle(self, method: str, path: str, headers: Dict[str, str], form: Any) -> Tuple[int, Any]:
+        delay = self.latency + (self.__random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay:
+            time.sleep(delay)
+        with self.__lock:
+            if self.error_rate and self.__random.random() < self.error_rate:
+                return 500, {'detail': 'Injected error.'}
+            return self.__dispatch(method, path.split('/api/v1/', 1)[-1], headers, form)
+
+    def __dispatch(self, method: str, path: str, headers: Dict[str, str], form: Any) -> Tuple[int, Any]:
+        if (method, path) == ('POST', 'auth/login/'):
+            return self.__login(form)
+        if (method, path) == ('POST', 'auth/registration/'):
+            return self.__register(form)
+
+        username = self.__tokens.get(headers.get('Authorization', '').replace('Token ', '', 1))
+        if username is None:
+            return 401, {'detail': 'Invalid token.'}
+        items = self.__items[username]
+
+        if (method, path) == ('GET', 'shopping-list/'):
+            return 200, list(items.values())
+        if (method, path) == ('POST', 'shopping-list/add/'):
+            return self.__add(items, form)
+        if (method, path) == ('POST', 'shopping-list/batch/'):
+            return self.__batch(items, form)
+        match = _edit_path.fullmatch(path)
+        if match is None:
+            return 404, {'detail': 'Not found.'}
+        if method == 'PATCH':
+            return self.__edit(items, int(match.group('id')), form)
+        if method == 'DELETE':
+            return self.__delete(items, int(match.group('id')))
+        return 405, {'detail': f'Method "{method}" not allowed.'}
+
+    def __add(self, items: Dict[int, Dict[str, Any]], form: Dict[str, Any]) -> Tuple[int, Any]:
+        item_id = self.__next_id
+        self.__next_id += 1
+        items[item_id] = {**self.__parse_item(form), 'id': item_id}
+        return 201, items[item_id]
+
+    def __edit(self, items: Dict[int, Dict[str, Any]], item_id: int, form: Dict[str, Any]) -> Tuple[int, Any]:
+        if item_id not in items:
+            return 404, {'detail': 'Not found.'}
+        items[item_id].update(self.__parse_item(form))
+        return 200, items[item_id]
+
+    def __delete(self, items: Dict[int, Dict[str, Any]], item_id: int) -> Tuple[int, Any]:
+        if item_id not in items:
+            return 404, {'detail': 'Not found.'}
+        del items[item_id]
+        return 204, None
+
+    def __batch(self, items: Dict[int, Dict[str, Any]], operations: Any) -> Tuple[int, Any]:
+        if not isinstance(operations, list):
+            return 400, {'detail': 'Expected a JSON array of operations.'}
+        results = []
+        for operation in operations:
+            op = operation.get('op') if isinstance(operation, dict) else None
+            if op == 'add' and isinstance(operation.get('item'), dict):
+                status, body = self.__add(items, operation['item'])
+            elif op == 'edit' and isinstance(operation.get('id'), int) and isinstance(operation.get('item'), dict):
+                status, body = self.__edit(items, operation['id'], operation['item'])
+            elif op == 'delete' and isinstance(operation.get('id'), int):
+                status, body = self.__delete(items, operation['id'])
+            else:
+                status, body = 400, {'detail': 'Invalid operation.'}
+            results.append({'status': status, 'body': body})
+        return 200, results
+
+    def __login(self, form: Dict[str, str]) -> Tuple[int, Any]:
+        user = self.__users.get(form.get('username'))
+        if user is None or user[1] != form.get('password'):
+            return 400, {'non_field_errors': ['Unable to log in with provided credentials.']}
+        token = secrets.token_hex(20)
+        self.__tokens[token] = form['username']
+        return 200, {'key': token}
+
+    def __register(self, form: Dict[str, str]) -> Tuple[int, Any]:
+        username = form.get('username')
+        if not username or username in self.__users or form.get('password1') != form.get('password2'):
+            return 400, {'username': ['A user with that username already exists.']}
+        self.__users[username] = (form.get('email', ''), form['password1'])
+        self.__items[username] = {}
+        token = secrets.token_hex(20)
+        self.__tokens[token] = username
+        return 201, {'key': token}
+
+    @staticmethod
+    def __parse_item(form: Dict[str, Any]) -> Dict[str, Any]:
+        item = dict(form)
+        for field in ('price', 'quantity'):
+            if field in item:
+                item[field] = int(item[field])
+        return item
+
+    def __handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def __serve(self) -> None:
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length).decode() if length else ''
+                if self.headers.get('Content-Type', '').startswith('application/json'):
+                    form = json.loads(body or 'null')
+                else:
+                    form = {key: values[-1] for key, values in parse_qs(body, keep_blank_values=True).items()}
+                status, payload = server.handle(self.command, self.path, dict(self.headers), form)
+                content = json.dumps(payload).encode() if payload is not None else b''
+                headers = {'Content-Type': 'application/json'}
+                if self.command == 'GET' and status == 200:
+                    headers['ETag'] = f'"{hashlib.sha1(content).hexdigest()}"'
+                    if self.headers.get('If-None-Match') == headers['ETag']:
+                        status, content = 304, b''
+                if content and 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    content = gzip.compress(content)
+                    headers['Content-Encoding'] = 'gzip'
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = __serve
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
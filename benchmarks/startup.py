@@ -0,0 +1,69 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from shopping_list import token_cache
+
+ROOT = Path(__file__).parent.parent
+_import_line = re.compile(r'import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent>\s+)(?P<module>\S+)')
+
+
+def import_times(module: str = 'shopping_list.app') -> Dict[str, int]:
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    times = {}
+    for line in completed.stderr.splitlines():
+        match = _import_line.match(line)
+        if match and len(match.group('indent')) <= 3:
+            times[match.group('module')] = int(match.group('cumulative'))
+    return times
+
+
+def time_to_first_prompt() -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        return _time_to_first_prompt({**os.environ, 'PYTHONUNBUFFERED': '1',
+                                      token_cache.PATH_VARIABLE: str(Path(directory) / 'token')})
+
+
+def _time_to_first_prompt(env: Dict[str, str]) -> float:
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-u', '-m', 'shopping_list.app'], cwd=ROOT, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, env=env)
+    output = b''
+    while b'? ' not in output:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError(f'The app exited before the first prompt: {output.decode()}')
+        output += chunk
+    elapsed = time.perf_counter() - start
+    process.communicate(b'0\n')
+    if b'SIGN IN' not in output:
+        raise RuntimeError(f'Unexpected first screen: {output.decode()}')
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    runs: List[Dict[str, int]] = [import_times() for _ in range(args.runs)]
+    print(f"{'MODULE (cumulative import)':<40} {'MEDIAN ms':>10}")
+    for module in sorted(runs[0], key=lambda name: -runs[0][name])[:10]:
+        values = [run[module] for run in runs if module in run]
+        print(f'{module:<40} {statistics.median(values) / 1000:>10.1f}')
+
+    prompts = [time_to_first_prompt() for _ in range(args.runs)]
+    print(f'time to first prompt: median {statistics.median(prompts) * 1000:.1f}ms, '
+          f'min {min(prompts) * 1000:.1f}ms over {args.runs} runs')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import random
+import time
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+from shopping_list.index import TextIndex
+
+BRANDS = ('Galaxy', 'Pixel', 'Iphone', 'Redmi', 'Xperia', 'Macbook', 'Thinkpad', 'Inspiron', 'Zenbook', 'Surface')
+WORDS = ('black', 'white', 'silver', 'refurbished', 'gaming', 'business', 'student', 'ultralight', 'waterproof',
+         'dual', 'sim', 'camera', 'battery', 'screen', 'keyboard', 'touch', 'storage', 'memory', 'charger', 'case',
+         'wireless', 'fast', 'display', 'warranty', 'gift', 'office', 'travel', 'premium', 'budget', 'compact')
+MODELS = ('Pro', 'Max', 'Carbon', 'Lite', 'Air', 'Ultra', 'Mini', 'Plus')
+QUERIES = ('pixel', 'pix', 'pixle', 'thinkpad carbon', 'waterprof camera', 'silver macbok 14', 'qzxv')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.text_search')
+    parser.add_argument('--items', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    rows = [(('Smartphone', f'{rng.choice(BRANDS)} {rng.choice(MODELS)} {rng.randint(1, 20)}', f'Maker {index}'),
+             ' '.join(rng.sample(WORDS, 5))) for index in range(args.items)]
+    index = TextIndex()
+    start = time.perf_counter()
+    for key, description in rows:
+        index.add(key, key[1], description)
+    build = time.perf_counter() - start
+    print(f'indexed {args.items} items in {build:.2f}s ({build / args.items * 1e6:.1f}us/item)')
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            results = index.search(query)
+        elapsed = (time.perf_counter() - start) / args.repeat
+        top = f'{results[0][0][1]} ({results[0][1]:.2f})' if results else None
+        print(f'{query!r:22} {elapsed * 1000:8.3f}ms  top: {top}')
+
+    start = time.perf_counter()
+    for key, description in rows[:1000]:
+        index.remove(key)
+        index.add(key, key[1], description)
+    print(f'remove + add: {(time.perf_counter() - start) / 1000 * 1e6:.1f}us/item')
+
+
+if __name__ == '__main__':
+    main()
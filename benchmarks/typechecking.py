@@ -0,0 +1,38 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from validation.typechecking import ENV_VARIABLE
+
+ROOT = Path(__file__).parent.parent
+
+
+def run_suite(pattern: str, typecheck: bool, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        output = Path(directory) / 'results.json'
+        subprocess.run([sys.executable, '-m', 'benchmarks', '-k', pattern, '-r', str(repeat), '-o', str(output)],
+                       cwd=ROOT, env={**os.environ, ENV_VARIABLE: '1' if typecheck else '0'},
+                       check=True, stdout=subprocess.DEVNULL)
+        return json.loads(output.read_text())['benchmarks']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.typechecking')
+    parser.add_argument('-k', '--pattern', default='shopping_list.*')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    checked = run_suite(args.pattern, True, args.repeat)
+    unchecked = run_suite(args.pattern, False, args.repeat)
+    print(f"{'BENCHMARK':<45} {'CHECKED us':>12} {'UNCHECKED us':>13} {'OVERHEAD us':>12} {'SPEEDUP':>8}")
+    for name in sorted(checked):
+        print(f'{name:<45} {checked[name] * 1e6:>12.3f} {unchecked[name] * 1e6:>13.3f} '
+              f'{(checked[name] - unchecked[name]) * 1e6:>12.3f} {checked[name] / unchecked[name]:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import os
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+os.environ.setdefault('SHOPPING_LIST_TYPECHECK', '0')
+
+from shopping_list.persistent import PersistentVector
+
+
+def copy_change(version: Any, index: int, value: int) -> Any:
+    current = list(version)
+    current[index] = value
+    return tuple(current)
+
+
+def persistent_change(version: Any, index: int, value: int) -> Any:
+    return version.set(index, value)
+
+
+def changes(initial: Any, change: Callable[[Any, int, int], Any], size: int, count: int) -> List[Any]:
+    versions = [initial]
+    for step in range(count):
+        versions.append(change(versions[-1], step % size, -step))
+    return versions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.undo_history')
+    parser.add_argument('--changes', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'{args.changes} single item changes, each kept as a version, best of {args.repeat}')
+    for size in (10, 1000, 100_000):
+        for name, initial, change in (('tuple copy', tuple(range(size)), copy_change),
+                                      ('persistent', PersistentVector.of(range(size)), persistent_change)):
+            elapsed = min(timeit.repeat(lambda: changes(initial, change, size, args.changes), number=1,
+                                        repeat=args.repeat))
+            tracemalloc.start()
+            versions = changes(initial, change, size, args.changes)
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            print(f'{name:10} {size:>7} items: {elapsed / args.changes * 1e6:8.1f}us/change '
+                  f'{memory / (len(versions) - 1) / 1024:8.2f}KiB/version')
+            del versions
+
+
+if __name__ == '__main__':
+    main()
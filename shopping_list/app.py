@@ -1,18 +1,20 @@
-from getpass import getpass
-from wsgiref import headers
-
+import argparse
 import csv
 import sys
+import time
+from contextlib import nullcontext, suppress
 from pathlib import Path
-from typing import Tuple, Callable, Any
-import requests
+from typing import Tuple, Callable, Any, Optional, Iterable, List, ContextManager, Dict, Union
 
 from valid8 import validate, ValidationError
 
+from shopping_list import token_cache
 from shopping_list.domain import ShoppingList, Smartphone, Computer, Name, Manufacturer, Quantity, Price, Description, \
     Username, \
     Password, Email
+from shopping_list.instrumentation import timed, count, record
 from shopping_list.menu import Menu, MenuDescription, Entry
+from shopping_list.resilience import Resilience
 
 api_server = 'http://localhost:8000/api/v1/'
 
@@ -20,14 +22,35 @@ api_server = 'http://localhost:8000/api/v1/'
 class App:
     __filename = Path(__file__).parent.parent / 'shoppingList.csv'
     __delimiter = '\t'
+    __settle_timeout = 30.0
+    __validator_headers = (('ETag', 'If-None-Match'), ('Last-Modified', 'If-Modified-Since'))
+    __batch_success = {'add': (201,), 'edit': (200,), 'delete': (204, 404)}
     __logged = False
     __key = None
-    __id_dictionary = []
 
-    def __init__(self):
+    def __init__(self, asynchronous: bool = False, refresh: Optional[float] = None, refresh_jitter: float = 0.0,
+                 use_token_cache: bool = True):
         self.__first_menu = self.init_first_menu()
         self.__menu = self.__init_shopping_list_menu()
         self.__shoppinglist = ShoppingList()
+        self.__id_dictionary = []
+        self.__username = None
+        self.__validators = {}
+        self.__full_fetch = 0.0
+        self.__body = None
+        self.__http = Resilience()
+        self.__background = None
+        if refresh is not None:
+            validate('refresh', refresh, min_value=0, min_strict=True)
+        validate('refresh_jitter', refresh_jitter, min_value=0)
+        self.__refresh = refresh
+        self.__refresh_jitter = refresh_jitter
+        self.__refresher = None
+        self.__generation = 0
+        self.__use_token_cache = use_token_cache
+        if asynchronous:
+            from shopping_list.background import BackgroundLoop
+            self.__background = BackgroundLoop()
 
     def init_first_menu(self) -> Menu:
         return Menu.Builder(MenuDescription('SIGN IN'), auto_select=lambda: print('Welcome!')) \
@@ -44,38 +67,68 @@ class App:
             .with_entry(Entry.create('4', 'Change quantity', on_selected=lambda: self.__change_quantity())) \
             .with_entry(Entry.create('5', 'Sort by Manufacturer', on_selected=lambda: self.__sort_by_manufacturer())) \
             .with_entry(Entry.create('6', 'Sort by Price', on_selected=lambda: self.__sort_by_price())) \
+            .with_entry(Entry.create('7', 'Search', on_selected=lambda: self.__search())) \
+            .with_entry(Entry.create('8', 'Import from file', on_selected=lambda: self.__import())) \
+            .with_entry(Entry.create('9', 'Clear list', on_selected=lambda: self.__clear())) \
+            .with_entry(Entry.create('f', 'Find by words', on_selected=lambda: self.__find())) \
+            .with_entry(Entry.create('u', 'Undo', on_selected=lambda: self.__undo())) \
+            .with_entry(Entry.create('r', 'Redo', on_selected=lambda: self.__redo())) \
             .with_entry(Entry.create('0', 'Exit', on_selected=lambda: print('Bye!'), is_exit=True)) \
             .build()
 
     def __login(self) -> bool:
+        import requests
+
         username = self.__read("Username", Username)
         password = self.__read("Password", Password)
-        res = requests.post(url=f'{api_server}auth/login/', data={'username': username, 'password': password})
+        res = self.__http.call('http.login', lambda timeout: requests.post(
+            url=f'{api_server}auth/login/', data={'username': username, 'password': password}, timeout=timeout))
         if res.status_code != 200:
             print('This user does not exist!')
             return False
         self.__key = res.json()['key']
+        if username != self.__username:
+            self.__username = username
+            self.__validators = {}
+        if self.__use_token_cache:
+            with suppress(OSError):
+                token_cache.save(self.__key)
         return True
 
     def __register(self) -> None:
+        import requests
+
         username = self.__read("Username", Username)
         email = self.__read("Email", Email)
         password = self.__read("Password", Password)
 
-        res = requests.post(url=f'{api_server}auth/registration/',
-                            data={'username': username, 'email': email, 'password1': password,
-                                  'password2': password})
+        res = self.__http.call('http.register', lambda timeout: requests.post(
+            url=f'{api_server}auth/registration/',
+            data={'username': username, 'email': email, 'password1': password, 'password2': password},
+            timeout=timeout))
         if res.status_code == 400:
             print('This user already exists!')
 
+    @timed('render.items')
     def __print_items(self) -> None:
+        self.__report_failures()
+        self.__apply_refresh()
+        self.__print_table(self.__shoppinglist)
+        print(f'TOTAL: {self.__shoppinglist.total()} '
+              f'({self.__shoppinglist.items()} items, {self.__shoppinglist.total_quantity()} pieces)')
+        for title, subtotals in (('BY CATEGORY', self.__shoppinglist.subtotals_by_category()),
+                                 ('BY MANUFACTURER', self.__shoppinglist.subtotals_by_manufacturer())):
+            if subtotals:
+                print(f'{title}: ' + ', '.join(f'{key} {price}' for key, price in subtotals.items()))
+
+    @staticmethod
+    def __print_table(items: Iterable[Any]) -> None:
         print_sep = lambda: print('-' * 200)
         print_sep()
         fmt = '%-3s %-30s %-30s %-30s %-30s %-30s %-50s'
         print(fmt % ('#', 'CATEGORY', 'NAME', 'MANUFACTURER', 'PRICE', 'QUANTITY', 'DESCRIPTION'))
         print_sep()
-        for index in range(self.__shoppinglist.items()):
-            item = self.__shoppinglist.item(index)
+        for index, item in enumerate(items):
             print(fmt % (index + 1, item.category, item.name, item.manufacturer, item.price, item.quantity,
                          item.description))
 
@@ -85,19 +138,22 @@ class App:
         smartphone = Smartphone(*self.__read_item())
         try:
             self.__shoppinglist.add_smartphone(smartphone)
-            self.__save(smartphone)
-            print('Smartphone added!')
         except ValueError:
             print('Smartphone already present in the list!')
+            return
+        if self.__mutate(f'Add {smartphone.name}', lambda: self.__save(smartphone),
+                         lambda: self.__discard(smartphone)):
+            print('Smartphone added!')
 
     def __add_computer(self) -> None:
         computer = Computer(*self.__read_item())
         try:
             self.__shoppinglist.add_computer(computer)
-            self.__save(computer)
-            print('Computer added!')
         except ValueError:
             print('Computer already present in the list!')
+            return
+        if self.__mutate(f'Add {computer.name}', lambda: self.__save(computer), lambda: self.__discard(computer)):
+            print('Computer added!')
 
     def __remove_item(self) -> None:
         def builder(value: str) -> int:
@@ -108,9 +164,11 @@ class App:
         if index == 0:
             print('Operation cancelled!')
             return
-        self.__delete(self.__shoppinglist.item(index - 1))
+        item = self.__shoppinglist.item(index - 1)
         self.__shoppinglist.remove_item(index - 1)
-        print('Item removed!')
+        if self.__mutate(f'Remove {item.name}', lambda: self.__delete(item), lambda: self.__restore(item),
+                         self.__batch_success['delete']):
+            print('Item removed!')
 
     def __change_quantity(self) -> None:
         def builder(value: str) -> int:
@@ -123,9 +181,64 @@ class App:
             return
 
         quantity = self.__read('New Quantity', Quantity.cast)
+        previous = self.__shoppinglist.item(index - 1)
         self.__shoppinglist.change_quantity(index - 1, quantity)
-        self.__update(self.__shoppinglist.item(index - 1))
-        print('Quantity changed!')
+        item = self.__shoppinglist.item(index - 1)
+        if self.__mutate(f'Change quantity of {item.name}', lambda: self.__update(item),
+                         lambda: self.__reset_quantity(previous)):
+            print('Quantity changed!')
+
+    def __mutate(self, description: str, job: Callable[[], Any], undo: Callable[[], None],
+                 accepted: Tuple[int, ...] = ()) -> bool:
+        import requests
+
+        self.__generation += 1
+        if self.__background is not None:
+            self.__background.submit(description, lambda: self.__confirm(job(), accepted), undo)
+            return True
+        try:
+            self.__confirm(job(), accepted)
+        except (requests.RequestException, RuntimeError) as e:
+            undo()
+            print(f'Could not sync "{description}": {e}. The change was reverted.')
+            return False
+        return True
+
+    @staticmethod
+    def __confirm(res: Any, accepted: Tuple[int, ...] = ()) -> None:
+        if res is not None and res.status_code >= 400 and res.status_code not in accepted:
+            raise RuntimeError(f'the server answered {res.status_code}')
+
+    def __settle(self) -> None:
+        if self.__background is not None and not self.__background.wait(self.__settle_timeout):
+            print(f'{self.__background.pending} changes are still being sent to the server...')
+
+    def __report_failures(self) -> None:
+        if self.__background is None:
+            return
+        for failure in self.__background.failures():
+            failure.undo()
+            print(f'Could not sync "{failure.description}": {failure.error}. The change was reverted.')
+
+    def __position(self, item: Any) -> Optional[int]:
+        return next((index for index, other in enumerate(self.__shoppinglist) if other.key == item.key), None)
+
+    def __discard(self, item: Any) -> None:
+        index = self.__position(item)
+        if index is not None:
+            self.__shoppinglist.remove_item(index)
+
+    def __reset_quantity(self, item: Any) -> None:
+        index = self.__position(item)
+        if index is not None:
+            self.__shoppinglist.change_quantity(index, item.quantity)
+
+    def __restore(self, item: Any) -> None:
+        with suppress(ValueError):
+            if item.category == 'Smartphone':
+                self.__shoppinglist.add_smartphone(item)
+            else:
+                self.__shoppinglist.add_computer(item)
 
     def __sort_by_manufacturer(self) -> None:
         self.__shoppinglist.sort_by_manufacturer()
@@ -133,77 +246,399 @@ class App:
     def __sort_by_price(self) -> None:
         self.__shoppinglist.sort_by_price()
 
+    def __search(self) -> None:
+        def category_builder(value: str) -> Optional[str]:
+            validate('value', value, is_in={'', 'Smartphone', 'Computer'})
+            return value or None
+
+        def optional(builder: Callable) -> Callable:
+            return lambda value: builder(value) if value else None
+
+        category = self.__read('Category (empty for any)', category_builder)
+        manufacturer = self.__read('Manufacturer (empty for any)', optional(Manufacturer.of))
+        min_price = self.__read('Min price (empty for any)', optional(Price.parse))
+        max_price = self.__read('Max price (empty for any)', optional(Price.parse))
+        name_prefix = self.__read('Name prefix (empty for any)', str)
+
+        price_between = (min_price, max_price) if min_price is not None or max_price is not None else None
+        items = self.__shoppinglist.filter(category=category, manufacturer=manufacturer,
+                                           price_between=price_between, name_prefix=name_prefix or None)
+        if not items:
+            print('No items found!')
+            return
+        self.__print_table(items)
+
+    def __find(self) -> None:
+        query = self.__read('Words in name or description (empty to cancel operation)', str)
+        if not query:
+            print('Operation cancelled!')
+            return
+        items = self.__shoppinglist.search(query)
+        if not items:
+            print('No items found!')
+            return
+        self.__print_table(items)
+
+    def __import(self) -> None:
+        path = self.__read(f'File (empty for {self.__filename.name})',
+                           lambda value: Path(value) if value else self.__filename)
+        try:
+            with open(path, newline='', encoding='utf-8') as file:
+                rows = [(number, row) for number, row in enumerate(csv.reader(file, delimiter=self.__delimiter), 1)
+                        if any(value.strip() for value in row)]
+        except OSError as e:
+            print(e)
+            return
+
+        from shopping_list.bulk import build_items
+
+        for number, row in rows:
+            if len(row) != 6:
+                print(f'Row {number}: expected 6 columns, found {len(row)}')
+        rows = [(number, row) for number, row in rows if len(row) == 6]
+        columns = [[row[column].strip() for _, row in rows] for column in range(6)]
+        try:
+            prices = Price.parse_cents(columns[3])
+        except (TypeError, ValueError):
+            prices = [self.__parse_or_keep(lambda value: Price.parse(value).value_in_cents, value)
+                      for value in columns[3]]
+        quantities = [self.__parse_or_keep(int, value) for value in columns[4]]
+        items, validation = build_items(columns[0], columns[1], columns[2], prices, quantities, columns[5])
+        for error in validation.errors:
+            print(f'Row {rows[error.row][0]} ({error.field}): {error.message}')
+
+        added = []
+        for _, item in items:
+            try:
+                if item.category == 'Smartphone':
+                    self.__shoppinglist.add_smartphone(item)
+                else:
+                    self.__shoppinglist.add_computer(item)
+                added.append(item)
+            except ValueError:
+                print(f'{item.category} {item.name} not imported: already present or the list is full')
+
+        imported = 0
+        self.__generation += 1
+        self.__settle()
+        if added:
+            try:
+                results = self.__batch([{'op': 'add', 'item': self.__payload(item)} for item in added])
+            except RuntimeError as e:
+                results = [{'status': 0}] * len(added)
+                print(e)
+            for item, result in zip(added, results):
+                if result['status'] in self.__batch_success['add']:
+                    self.__id_dictionary.append([int(result['body']['id']), item.name.value, item.manufacturer.value])
+                    imported += 1
+                else:
+                    self.__discard(item)
+        print(f'{imported} items imported!')
+
+    @staticmethod
+    def __parse_or_keep(parse: Callable[[Any], int], value: Any) -> Union[int, str]:
+        try:
+            return parse(value)
+        except (TypeError, ValueError):
+            return str(value)
+
+    def __clear(self) -> None:
+        self.__generation += 1
+        self.__settle()
+        kept = []
+        if self.__id_dictionary:
+            try:
+                results = self.__batch([{'op': 'delete', 'id': entry[0]} for entry in self.__id_dictionary])
+            except RuntimeError as e:
+                print(e)
+                print('Shopping list not cleared!')
+                return
+            kept = [entry for entry, result in zip(self.__id_dictionary, results)
+                    if result['status'] not in self.__batch_success['delete']]
+        failed = {(entry[1], entry[2]) for entry in kept}
+        for item in [item for item in self.__shoppinglist if (item.name.value, item.manufacturer.value) not in failed]:
+            self.__discard(item)
+        self.__id_dictionary[:] = kept
+        print('Shopping list cleared!' if not kept else f'{len(kept)} items could not be removed!')
+
+    def __undo(self) -> None:
+        self.__travel(self.__shoppinglist.undo, self.__shoppinglist.redo, 'Nothing to undo!', 'Undone!')
+
+    def __redo(self) -> None:
+        self.__travel(self.__shoppinglist.redo, self.__shoppinglist.undo, 'Nothing to redo!', 'Redone!')
+
+    def __travel(self, move: Callable[[], bool], back: Callable[[], bool], nothing: str, done: str) -> None:
+        from shopping_list.reconcile import diff
+
+        self.__settle()
+        before = list(self.__shoppinglist)
+        if not move():
+            print(nothing)
+            return
+        self.__generation += 1
+        changes = diff(before, self.__shoppinglist)
+        if changes:
+            try:
+                failed = self.__sync(changes)
+            except RuntimeError as e:
+                back()
+                print(e)
+                print('Nothing changed!')
+                return
+            if failed:
+                print(f'{failed} changes could not be sent to the server!')
+        print(done)
+
+    def __sync(self, changes: Any) -> int:
+        entries = {(entry[1], entry[2]): entry for entry in self.__id_dictionary}
+        operations, targets = [], []
+        for item in changes.added:
+            operations.append({'op': 'add', 'item': self.__payload(item)})
+            targets.append(item)
+        for item in changes.edited:
+            entry = entries.get((item.name.value, item.manufacturer.value))
+            if entry is not None:
+                operations.append({'op': 'edit', 'id': entry[0], 'item': self.__payload(item)})
+                targets.append(entry)
+        for _, name, manufacturer in changes.deleted:
+            entry = entries.get((name, manufacturer))
+            if entry is not None:
+                operations.append({'op': 'delete', 'id': entry[0]})
+                targets.append(entry)
+        if not operations:
+            return 0
+
+        failed = 0
+        for operation, target, result in zip(operations, targets, self.__batch(operations)):
+            if result['status'] not in self.__batch_success[operation['op']]:
+                failed += 1
+            elif operation['op'] == 'add':
+                self.__id_dictionary.append([int(result['body']['id']), target.name.value, target.manufacturer.value])
+            elif operation['op'] == 'delete':
+                self.__id_dictionary.remove(target)
+        return failed
+
     def __run(self) -> None:
-        while not self.__first_menu.run() == (True, False):
+        self.__key = token_cache.load() if self.__use_token_cache else None
+        while self.__key is not None or not self.__first_menu.run() == (True, False):
             try:
                 self.__fetch()
+            except PermissionError:
+                print('Session expired! Please, login again.')
+                self.__forget_token()
+                self.__key = None
+                continue
             except ValueError as e:
-                print('Continuing with an empty list of items...')
+                print(e)
+                print(f'Continuing with the {self.__shoppinglist.items()} items that could be loaded...')
             except RuntimeError:
                 print('Failed to connect to the server! Try later!')
                 return
-            self.__menu.run()
+            self.__refresher = self.__start_refresh()
+            try:
+                self.__menu.run()
+            finally:
+                if self.__refresher is not None:
+                    self.__refresher.stop(self.__settle_timeout)
+                    self.__refresher = None
+            self.__settle()
+            self.__key = None
+
+    def __forget_token(self) -> None:
+        if self.__use_token_cache:
+            token_cache.clear()
 
     def run(self) -> None:
+        if self.__background is not None:
+            self.__background.start()
         try:
             self.__run()
         except Exception as e:
             print(e)
             print('Panic error!', file=sys.stderr)
+        finally:
+            if self.__background is not None:
+                unsent = self.__background.stop(self.__settle_timeout)
+                if unsent:
+                    print(f'{unsent} changes could not be sent to the server!')
+                self.__report_failures()
 
     def __fetch(self) -> None:
-        res = requests.get(url=f'{api_server}shopping-list/', headers={'Authorization': f'Token {self.__key}'})
+        self.__settle()
+        self.__load(*self.__request_list(self.__key, self.__validators))
 
+    def __request_list(self, key: str, validators: Dict[str, str]) -> Tuple[Any, float]:
+        import requests
+
+        start = time.perf_counter()
+        headers = {'Authorization': f'Token {key}', 'Accept-Encoding': 'gzip', **validators}
+        try:
+            res = self.__http.call('http.fetch', lambda timeout: requests.get(
+                url=f'{api_server}shopping-list/', headers=headers, timeout=timeout), idempotent=True)
+        except requests.RequestException as e:
+            raise RuntimeError() from e
+        return res, time.perf_counter() - start
+
+    def __load(self, res: Any, elapsed: float) -> None:
+        loaded = self.__parse_list(res, elapsed)
+        if loaded is None:
+            return
+        rows, errors = loaded
+        self.__shoppinglist.clear()
+        self.__id_dictionary.clear()
+        for item_id, item in rows:
+            self.__id_dictionary.append([item_id, item.name.value, item.manufacturer.value])
+            if item.category == 'Smartphone':
+                self.__shoppinglist.add_smartphone(item)
+            else:
+                self.__shoppinglist.add_computer(item)
+        self.__shoppinglist.forget_history()
+        self.__loaded(res)
+        self.__reject(errors)
+
+    def __merge(self, res: Any, elapsed: float) -> None:
+        from shopping_list.reconcile import by_key, diff
+
+        if res.status_code == 200 and res.content == self.__body:
+            count('refresh.unchanged')
+            return
+        loaded = self.__parse_list(res, elapsed)
+        if loaded is None:
+            return
+        rows, errors = loaded
+        self.__id_dictionary[:] = [[item_id, item.name.value, item.manufacturer.value] for item_id, item in rows]
+        remote = by_key(item for _, item in rows)
+        changes = diff(self.__shoppinglist, remote)
+        if changes:
+            self.__shoppinglist.replace_all([remote[item.key] for item in self.__shoppinglist if item.key in remote]
+                                            + changes.added)
+        else:
+            count('refresh.unchanged')
+        self.__loaded(res)
+        self.__reject(errors)
+
+    def __parse_list(self, res: Any, elapsed: float) -> Optional[Tuple[List[Tuple[int, Any]], List[Any]]]:
+        if res.status_code == 401:
+            raise PermissionError()
+        if res.status_code == 304:
+            count('http.fetch.not_modified')
+            record('http.fetch.saved', max(0.0, self.__full_fetch - elapsed))
+            return None
         if res.status_code != 200:
             raise RuntimeError()
 
+        from shopping_list.bulk import build_items
+
+        start = time.perf_counter()
+        count('http.fetch.bytes', int(res.headers.get('Content-Length', len(res.content))))
+        count('http.fetch.bytes_decoded', len(res.content))
         json = res.json()
         for item in json:
             validate('row length', item, length=7)
 
-            item_id = int(item['id'])
-            name = Name(str(item['name']))
-            category = str(item['category'])
-            manufacturer = Manufacturer(str(item['manufacturer']))
-            price = Price.create(int(int(item['price']) / 100), int(item['price']) % 100)
-            quantity = Quantity(int(item['quantity']))
+        items, validation = build_items([str(item['category']) for item in json], [str(item['name']) for item in json],
+                                        [str(item['manufacturer']) for item in json],
+                                        [self.__parse_or_keep(int, item['price']) for item in json],
+                                        [self.__parse_or_keep(int, item['quantity']) for item in json],
+                                        [str(item['description']) for item in json])
+        self.__full_fetch = elapsed + time.perf_counter() - start
+        return [(int(json[row]['id']), item) for row, item in items], validation.errors
 
-            self.__id_dictionary.append([item_id, name.value, manufacturer.value])
+    def __loaded(self, res: Any) -> None:
+        self.__body = res.content
+        self.__validators = {request: res.headers[response] for response, request in self.__validator_headers
+                             if response in res.headers}
 
-            description = Description(str(item['description']))
+    @staticmethod
+    def __reject(errors: List[Any]) -> None:
+        if errors:
+            raise ValueError('\n'.join(f'Row {error.row + 1} ({error.field}): {error.message}' for error in errors))
 
-            if category == 'Smartphone':
-                self.__shoppinglist.add_smartphone(Smartphone(name, manufacturer, price, quantity, description))
-            elif category == 'Computer':
-                self.__shoppinglist.add_computer(Computer(name, manufacturer, price, quantity, description))
-            else:
-                raise ValueError('Unknown item category in your shopping list')
+    def __start_refresh(self) -> Optional[Any]:
+        if self.__refresh is None:
+            return None
+
+        from shopping_list.refresh import Refresher
+
+        key = self.__key
+        return Refresher(lambda: (self.__generation, *self.__request_list(key, self.__validators)),
+                         self.__refresh, self.__refresh_jitter).start()
+
+    def __apply_refresh(self) -> None:
+        latest = self.__refresher.take() if self.__refresher is not None else None
+        if latest is None:
+            return
+        generation, res, elapsed = latest
+        if generation != self.__generation or (self.__background is not None and self.__background.pending):
+            count('refresh.stale')
+            return
+        try:
+            self.__merge(res, elapsed)
+        except ValueError as e:
+            print(e)
+        except PermissionError:
+            count('refresh.failures')
+            print('Session expired! Please, login again.')
+            self.__forget_token()
+            self.__refresher.stop(self.__settle_timeout)
+        except RuntimeError:
+            count('refresh.failures')
+
+    @staticmethod
+    def __payload(item: Any) -> Dict[str, Any]:
+        return {'name': item.name.value, 'category': item.category, 'manufacturer': item.manufacturer.value,
+                'price': item.price.value_in_cents, 'quantity': item.quantity.value,
+                'description': item.description.value}
 
-    def __save(self, item: Any) -> None:
-        req = requests.post(url=f'{api_server}shopping-list/add/',
-                            headers={'Authorization': f'Token {self.__key}'},
-                            data={'name': item.name.value, 'category': item.category,
-                                  'manufacturer': item.manufacturer.value, 'price': item.price.value_in_cents,
-                                  'quantity': item.quantity.value, 'description': item.description.value})
+    def __save(self, item: Any) -> Any:
+        import requests
+
+        req = self.__http.call('http.save', lambda timeout: requests.post(
+            url=f'{api_server}shopping-list/add/', headers={'Authorization': f'Token {self.__key}'},
+            data=self.__payload(item), timeout=timeout))
+        if req.status_code >= 400:
+            return req
 
         self.__id_dictionary.append([req.json()['id'], item.name.value, item.manufacturer.value])
+        return req
+
+    def __batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        import requests
+
+        try:
+            res = self.__http.call('http.batch', lambda timeout: requests.post(
+                url=f'{api_server}shopping-list/batch/', headers={'Authorization': f'Token {self.__key}'},
+                json=operations, timeout=timeout))
+        except requests.RequestException as e:
+            raise RuntimeError(f'Batch request failed: {e}') from e
+        if res.status_code != 200:
+            raise RuntimeError(f'Batch request failed with status {res.status_code}')
+        return res.json()
+
+    def __update(self, item: Any) -> Any:
+        import requests
 
-    def __update(self, item: Any) -> None:
         for i in range(len(self.__id_dictionary)):
             if (item.name.value, item.manufacturer.value) == (self.__id_dictionary[i][1], self.__id_dictionary[i][2]):
-                requests.patch(url=f'{api_server}shopping-list/edit/{self.__id_dictionary[i][0]}',
-                               headers={'Authorization': f'Token {self.__key}'}, data={'quantity': item.quantity.value})
-                break
+                item_id = self.__id_dictionary[i][0]
+                return self.__http.call('http.update', lambda timeout: requests.patch(
+                    url=f'{api_server}shopping-list/edit/{item_id}', headers={'Authorization': f'Token {self.__key}'},
+                    data={'quantity': item.quantity.value}, timeout=timeout), idempotent=True)
+        return None
+
+    def __delete(self, item: Any) -> Any:
+        import requests
 
-    def __delete(self, item: Any) -> None:
-        index = None
         for i in range(len(self.__id_dictionary)):
             if (item.name.value, item.manufacturer.value) == (self.__id_dictionary[i][1], self.__id_dictionary[i][2]):
-                requests.delete(url=f'{api_server}shopping-list/edit/{self.__id_dictionary[i][0]}',
-                                headers={'Authorization': f'Token {self.__key}'})
-                index = i
-                break
-        self.__id_dictionary.pop(index)
+                item_id = self.__id_dictionary[i][0]
+                res = self.__http.call('http.delete', lambda timeout: requests.delete(
+                    url=f'{api_server}shopping-list/edit/{item_id}', headers={'Authorization': f'Token {self.__key}'},
+                    timeout=timeout), idempotent=True)
+                if res.status_code in self.__batch_success['delete']:
+                    self.__id_dictionary.pop(i)
+                return res
+        return None
 
     @staticmethod
     def __read(prompt: str, builder: Callable) -> Any:
@@ -221,17 +656,64 @@ class App:
                 print(e)
 
     def __read_item(self) -> Tuple[Name, Manufacturer, Price, Quantity, Description]:
-        item = self.__read('Name', Name)
-        manufacturer = self.__read('Manufacturer', Manufacturer)
+        item = self.__read('Name', Name.of)
+        manufacturer = self.__read('Manufacturer', Manufacturer.of)
         quantity = self.__read('Quantity', Quantity.cast)
         price = self.__read('Price', Price.parse)
-        description = self.__read('Description', Description)
+        description = self.__read('Description', Description.of)
         return item, manufacturer, price, quantity, description
 
 
-def main(name: str):
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m shopping_list.app', allow_abbrev=False)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--profile', type=Path, metavar='FILE',
+                      help='run under cProfile, save the stats to FILE and print a report by subsystem')
+    mode.add_argument('--memory', type=Path, metavar='FILE',
+                      help='trace allocations, save a tracemalloc snapshot to FILE and print a report by subsystem')
+    http = parser.add_mutually_exclusive_group()
+    http.add_argument('--record', type=Path, metavar='FILE',
+                      help='save every API call and its response to FILE as JSON lines')
+    http.add_argument('--replay', type=Path, metavar='FILE',
+                      help='answer API calls with the responses recorded in FILE instead of the server')
+    parser.add_argument('--realtime', action='store_true',
+                        help='with --replay, wait the recorded latency before each response')
+    parser.add_argument('--async', dest='asynchronous', action='store_true',
+                        help='apply changes at once and send them to the server in the background')
+    parser.add_argument('--refresh', type=float, metavar='SECONDS',
+                        help='while logged in, check the server for changes every SECONDS seconds')
+    parser.add_argument('--refresh-jitter', type=float, default=0.0, metavar='SECONDS',
+                        help='with --refresh, add or subtract up to SECONDS at random to each interval')
+    args = parser.parse_args(argv)
+    if args.refresh is not None and args.refresh <= 0 or args.refresh_jitter < 0:
+        parser.error('--refresh must be positive and --refresh-jitter not negative')
+    return args
+
+
+def http_mode(args: argparse.Namespace) -> ContextManager:
+    if args.record:
+        from shopping_list.recording import record
+        return record(args.record)
+    if args.replay:
+        from shopping_list.recording import replay
+        return replay(args.replay, args.realtime)
+    return nullcontext()
+
+
+def main(name: str, argv: Optional[List[str]] = None):
     if name == '__main__':
-        App().run()
+        args = parse_args(sys.argv[1:] if argv is None else argv)
+        with http_mode(args):
+            app = App(args.asynchronous, args.refresh, args.refresh_jitter,
+                      use_token_cache=not (args.record or args.replay))
+            if args.profile:
+                from shopping_list.profiling import profile
+                profile(app.run, args.profile)
+            elif args.memory:
+                from shopping_list.profiling import trace_memory
+                trace_memory(app.run, args.memory)
+            else:
+                app.run()
 
 
 main(__name__)
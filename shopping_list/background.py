@@ -0,0 +1,102 @@
+import asyncio
+import threading
+from collections import deque
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from shopping_list.instrumentation import count
+
+Job = Tuple[str, Callable[[], Any], Callable[[], None]]
+
+
+def _run(job: Callable[[], Any]) -> Optional[BaseException]:
+    try:
+        job()
+    except BaseException as e:
+        return e
+    return None
+
+
+@dataclass(frozen=True)
+class Failure:
+    description: str
+    error: BaseException
+    undo: Callable[[], None]
+
+
+class BackgroundLoop:
+    def __init__(self):
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target=self.__loop.run_forever, name='shopping-list-sync', daemon=True)
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__worker_task: Optional[asyncio.Task] = None
+        self.__failures: Deque[Failure] = deque()
+        self.__pending = 0
+        self.__idle = threading.Condition()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self.__loop
+
+    def start(self) -> 'BackgroundLoop':
+        self.__thread.start()
+        asyncio.run_coroutine_threadsafe(self.__start_worker(), self.__loop).result()
+        return self
+
+    @property
+    def pending(self) -> int:
+        with self.__idle:
+            return self.__pending
+
+    def stop(self, timeout: Optional[float] = None) -> int:
+        unsent = 0 if self.wait(timeout) else self.pending
+        asyncio.run_coroutine_threadsafe(self.__stop_worker(), self.__loop).result(timeout)
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join(timeout)
+        if not self.__thread.is_alive():
+            self.__loop.close()
+        return unsent
+
+    def __enter__(self) -> 'BackgroundLoop':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def submit(self, description: str, job: Callable[[], Any], undo: Callable[[], None] = lambda: None) -> None:
+        with self.__idle:
+            self.__pending += 1
+        self.__loop.call_soon_threadsafe(self.__queue.put_nowait, (description, job, undo))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self.__idle:
+            return self.__idle.wait_for(lambda: self.__pending == 0, timeout)
+
+    def failures(self) -> List[Failure]:
+        failures = []
+        while self.__failures:
+            failures.append(self.__failures.popleft())
+        return failures
+
+    async def __start_worker(self) -> None:
+        self.__queue = asyncio.Queue()
+        self.__worker_task = self.__loop.create_task(self.__worker())
+
+    async def __stop_worker(self) -> None:
+        self.__worker_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.__worker_task
+
+    async def __worker(self) -> None:
+        while True:
+            description, job, undo = await self.__queue.get()
+            try:
+                error = await asyncio.to_thread(_run, job)
+                if error is not None:
+                    count('sync.failures')
+                    self.__failures.append(Failure(description, error, undo))
+            finally:
+                with self.__idle:
+                    self.__pending -= 1
+                    self.__idle.notify_all()
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple, Union
+
+from shopping_list.domain import Name, Manufacturer, Price, Quantity, Description, Smartphone, Computer
+from validation.typechecking import typechecked
+
+CATEGORIES = {'Smartphone': Smartphone, 'Computer': Computer}
+
+
+@typechecked
+@dataclass(frozen=True)
+class RowError:
+    row: int
+    field: str
+    message: str
+
+
+@typechecked
+@dataclass(frozen=True)
+class BulkValidation:
+    mask: List[bool]
+    errors: List[RowError] = field(default_factory=list)
+
+    def valid_rows(self) -> List[int]:
+        return [row for row, valid in enumerate(self.mask) if valid]
+
+
+def _range_mask(values: List[Union[int, str]], low: int, high: int) -> List[bool]:
+    return [isinstance(value, int) and low <= value <= high for value in values]
+
+
+@typechecked
+def validate_columns(categories: List[str], names: List[str], manufacturers: List[str],
+                     prices: List[Union[int, str]], quantities: List[Union[int, str]],
+                     descriptions: List[str]) -> BulkValidation:
+    rows = len(names)
+    for column in (categories, manufacturers, prices, quantities, descriptions):
+        if len(column) != rows:
+            raise ValueError('All columns must have the same length')
+
+    masks = {
+        'category': [category in CATEGORIES for category in categories],
+        'name': Name.validator.mask(names),
+        'manufacturer': Manufacturer.validator.mask(manufacturers),
+        'price': _range_mask(prices, 0, Price.max_value_in_cents),
+        'quantity': _range_mask(quantities, Quantity.min_value, Quantity.max_value),
+        'description': Description.validator.mask(descriptions),
+    }
+    mask = [all(valid) for valid in zip(*masks.values())]
+
+    errors = []
+    for row in (row for row, valid in enumerate(mask) if not valid):
+        for name, column_mask in masks.items():
+            if not column_mask[row]:
+                errors.append(RowError(row, name, _message(name, row, categories, names, manufacturers, prices,
+                                                           quantities, descriptions)))
+    return BulkValidation(mask, errors)
+
+
+def _message(name: str, row: int, categories: List[str], names: List[str], manufacturers: List[str],
+             prices: List[Union[int, str]], quantities: List[Union[int, str]], descriptions: List[str]) -> str:
+    if name == 'category':
+        return f'Unknown item category: {categories[row]}'
+    if name == 'name':
+        return Name.validator.error(names[row])
+    if name == 'manufacturer':
+        return Manufacturer.validator.error(manufacturers[row])
+    if name == 'description':
+        return Description.validator.error(descriptions[row])
+    value = prices[row] if name == 'price' else quantities[row]
+    if isinstance(value, str):
+        return f'Invalid {name}: {value}'
+    return f'{name.capitalize()} out of range: {value}'
+
+
+@typechecked
+def build_items(categories: List[str], names: List[str], manufacturers: List[str], prices: List[Union[int, str]],
+                quantities: List[Union[int, str]], descriptions: List[str]) \
+        -> Tuple[List[Tuple[int, Union[Smartphone, Computer]]], BulkValidation]:
+    validation = validate_columns(categories, names, manufacturers, prices, quantities, descriptions)
+    items = [(row, CATEGORIES[categories[row]](Name.of(names[row]), Manufacturer.of(manufacturers[row]),
+                                              Price.from_cents(prices[row]), Quantity.of(quantities[row]),
+                                              Description.of(descriptions[row])))
+             for row in validation.valid_rows()]
+    return items, validation
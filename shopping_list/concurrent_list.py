@@ -0,0 +1,127 @@
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from valid8 import validate
+
+from shopping_list.domain import ShoppingList, Smartphone, Computer, Manufacturer, Price, Quantity
+from shopping_list.totals import Totals
+from validation.typechecking import typechecked
+
+Item = Union[Smartphone, Computer]
+
+
+@typechecked
+@dataclass(frozen=True)
+class ShoppingListSnapshot:
+    version: int
+    __items: Tuple[Item, ...] = field(repr=False)
+
+    @cached_property
+    def __totals(self) -> Totals:
+        totals = Totals()
+        for item in self.__items:
+            totals.add(item.category, item.manufacturer.value, item.price.value_in_cents, item.quantity.value)
+        return totals
+
+    def items(self) -> int:
+        return len(self.__items)
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self.__items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Item, Tuple[Item, ...]]:
+        return self.__items[index]
+
+    def item(self, index: int) -> Item:
+        if not 0 <= index < len(self.__items):
+            validate('index', index, min_value=0, max_value=len(self.__items) - 1)
+        return self.__items[index]
+
+    def filter(self, category: Optional[str] = None, manufacturer: Optional[Manufacturer] = None,
+               price_between: Optional[Tuple[Optional[Price], Optional[Price]]] = None,
+               name_prefix: Optional[str] = None) -> List[Item]:
+        low, high = price_between if price_between is not None else (None, None)
+        prefix = name_prefix.lower() if name_prefix else None
+        return [item for item in self.__items
+                if (category is None or item.category == category)
+                and (manufacturer is None or item.manufacturer == manufacturer)
+                and (low is None or item.price >= low) and (high is None or item.price <= high)
+                and (prefix is None or item.name.value.lower().startswith(prefix))]
+
+    def total(self) -> Price:
+        return Price.from_cents(self.__totals.cents)
+
+    def total_quantity(self) -> int:
+        return self.__totals.quantity
+
+    def subtotals_by_category(self) -> Dict[str, Price]:
+        return {key: Price.from_cents(cents) for key, cents in self.__totals.by_category().items()}
+
+    def subtotals_by_manufacturer(self) -> Dict[str, Price]:
+        return {key: Price.from_cents(cents) for key, cents in self.__totals.by_manufacturer().items()}
+
+
+class ConcurrentShoppingList:
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__list = ShoppingList()
+        self.__snapshot = ShoppingListSnapshot(0, ())
+
+    def snapshot(self) -> ShoppingListSnapshot:
+        return self.__snapshot
+
+    def items(self) -> int:
+        return self.__snapshot.items()
+
+    def __len__(self) -> int:
+        return len(self.__snapshot)
+
+    def __iter__(self) -> Iterator[Item]:
+        return iter(self.__snapshot)
+
+    def item(self, index: int) -> Item:
+        return self.__snapshot.item(index)
+
+    def filter(self, *args, **kwargs) -> List[Item]:
+        return self.__snapshot.filter(*args, **kwargs)
+
+    def total(self) -> Price:
+        return self.__snapshot.total()
+
+    @contextmanager
+    def transaction(self) -> Iterator[ShoppingList]:
+        with self.__lock:
+            yield self.__list
+            self.__snapshot = ShoppingListSnapshot(self.__snapshot.version + 1, tuple(self.__list))
+
+    def __write(self, change: Callable[[ShoppingList], None]) -> ShoppingListSnapshot:
+        with self.transaction() as shopping_list:
+            change(shopping_list)
+        return self.__snapshot
+
+    def add_smartphone(self, smartphone: Smartphone) -> ShoppingListSnapshot:
+        return self.__write(lambda shopping_list: shopping_list.add_smartphone(smartphone))
+
+    def add_computer(self, computer: Computer) -> ShoppingListSnapshot:
+        return self.__write(lambda shopping_list: shopping_list.add_computer(computer))
+
+    def remove_item(self, index: int) -> ShoppingListSnapshot:
+        return self.__write(lambda shopping_list: shopping_list.remove_item(index))
+
+    def change_quantity(self, index: int, quantity: Quantity) -> ShoppingListSnapshot:
+        return self.__write(lambda shopping_list: shopping_list.change_quantity(index, quantity))
+
+    def sort_by_manufacturer(self) -> ShoppingListSnapshot:
+        return self.__write(lambda shopping_list: shopping_list.sort_by_manufacturer())
+
+    def sort_by_price(self) -> ShoppingListSnapshot:
+        return self.__write(lambda shopping_list: shopping_list.sort_by_price())
+
+    def clear(self) -> ShoppingListSnapshot:
+        return self.__write(lambda shopping_list: shopping_list.clear())
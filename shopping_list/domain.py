@@ -1,26 +1,40 @@
 import re
-from dataclasses import dataclass, InitVar, field
-from typing import Any, Union, List
+from dataclasses import dataclass, InitVar, field, replace
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Union, List, Optional, Tuple, Dict, Callable, Iterator, Iterable
 
-from typeguard import typechecked
+from validation.typechecking import typechecked
 from valid8 import validate
 from valid8 import ValidationError
+
+from shopping_list.index import ItemIndex, ItemKey
+from shopping_list.instrumentation import timed
+from shopping_list.persistent import PersistentVector, History
+from shopping_list.totals import Totals
 from validation.dataclasses import validate_dataclass
-from validation.regex import pattern
+from validation.regex import string_validator
 
 
 @typechecked
 @dataclass(frozen=True, order=True)
 class Name:
     value: str
+    validator = string_validator('value', r'[A-Za-z0-9 \-\_]+', min_len=1, max_len=25)
 
+    @timed('validation.Name')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=1, max_len=25, custom=pattern(r'[A-Za-z0-9 \-\_]+'))
+        self.validator(self.value)
 
     def __str__(self):
         return self.value
 
+    @staticmethod
+    @lru_cache(maxsize=1024, typed=True)
+    def of(value: str) -> 'Name':
+        return Name(value)
+
 
 
 
@@ -28,30 +42,45 @@ class Name:
 @dataclass(frozen=True, order=True)
 class Manufacturer:
     value: str
+    validator = string_validator('value', r'[A-Za-z \_\-\&]+', min_len=2, max_len=20)
 
+    @timed('validation.Manufacturer')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=2, max_len=20, custom=pattern(r'[A-Za-z \_\-\&]+'))
+        self.validator(self.value)
 
     def __str__(self):
         return self.value
 
+    @staticmethod
+    @lru_cache(maxsize=256, typed=True)
+    def of(value: str) -> 'Manufacturer':
+        return Manufacturer(value)
+
 
 @typechecked
 @dataclass(frozen=True, order=True)
 class Quantity:
     value: int
+    min_value = 1
+    max_value = 5
 
+    @timed('validation.Quantity')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_value=1, max_value=5)
+        validate('value', self.value, min_value=self.min_value, max_value=self.max_value)
 
     def __str__(self):
         return str(self.value)
 
+    @staticmethod
+    @lru_cache(maxsize=8, typed=True)
+    def of(value: int) -> 'Quantity':
+        return Quantity(value)
+
     @staticmethod
     def cast(value: str) -> 'Quantity':
-        return Quantity(int(value))
+        return Quantity.of(int(value))
 
 
 @typechecked
@@ -61,30 +90,55 @@ class Price:
     create_key: InitVar[Any] = field(default=None)
 
     __create_key = object()
-    __max_value = 100000000000 - 1
+    max_value_in_cents = 100000000000 - 1
     __parse_pattern = re.compile(r'(?P<euro>\d{0,11})(?:\.(?P<cents>\d{2}))?')
+    __parse_many_pattern = re.compile(r'^(\d{1,9})(?:\.(\d{2}))?$', re.MULTILINE)
 
+    @timed('validation.Price')
     def __post_init__(self, create_key):
-        validate('create_key', create_key, equals=self.__create_key)
-        validate_dataclass(self)
-        validate('value_in_cents', self.value_in_cents, min_value=0, max_value=self.__max_value)
+        value = self.value_in_cents
+        if create_key is not self.__create_key or type(value) is not int or not 0 <= value <= self.max_value_in_cents:
+            validate('create_key', create_key, equals=self.__create_key)
+            validate_dataclass(self)
+            validate('value_in_cents', value, min_value=0, max_value=self.max_value_in_cents)
 
     def __str__(self):
         return f'{self.value_in_cents // 100}.{self.value_in_cents % 100:02}'
 
     @staticmethod
     def create(euro: int, cents: int = 0) -> 'Price':
-        validate('euro', euro, min_value=0, max_value=Price.__max_value // 100)
-        validate('cents', cents, min_value=0, max_value=99)
+        if type(euro) is not int or type(cents) is not int or not 0 <= euro <= Price.max_value_in_cents // 100 \
+                or not 0 <= cents <= 99:
+            validate('euro', euro, min_value=0, max_value=Price.max_value_in_cents // 100)
+            validate('cents', cents, min_value=0, max_value=99)
         return Price(euro * 100 + cents, Price.__create_key)
 
+    @staticmethod
+    def from_cents(value_in_cents: int) -> 'Price':
+        return Price(value_in_cents, Price.__create_key)
+
     @staticmethod
     def parse(value: str) -> 'Price':
         m = Price.__parse_pattern.fullmatch(value)
         validate('value', m)
-        euro = m.group('euro')
-        cents = m.group('cents') if m.group('cents') else 0
-        return Price.create(int(euro), int(cents))
+        euro, cents = m.groups()
+        return Price(int(euro) * 100 + (int(cents) if cents else 0), Price.__create_key)
+
+    @staticmethod
+    def parse_cents(values: List[str]) -> List[int]:
+        joined = '\n'.join(values)
+        matches = Price.__parse_many_pattern.findall(joined) if joined.count('\n') == len(values) - 1 else []
+        if len(matches) != len(values):
+            return [Price.parse(value).value_in_cents for value in values]
+        return [int(euro + cents) if cents else int(euro) * 100 for euro, cents in matches]
+
+    @staticmethod
+    def sum_cents(values: Iterable[int]) -> 'Price':
+        return Price(sum(values), Price.__create_key)
+
+    @staticmethod
+    def sum(prices: Iterable['Price']) -> 'Price':
+        return Price(sum(price.value_in_cents for price in prices), Price.__create_key)
 
     @property
     def cents(self) -> int:
@@ -102,24 +156,36 @@ class Price:
 @dataclass(frozen=True, order=True)
 class Description:
     value: str
+    validator = string_validator('value', r'[A-Za-z0-9\_\-\(\)\.\,\;\&\:\=\è\'\"\! ]*', max_len=100)
 
+    @timed('validation.Description')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, max_len=100,
-                 custom=pattern(r'[A-Za-z0-9\_\-\(\)\.\,\;\&\:\=\è\'\"\! ]*'))
+        self.validator(self.value)
 
     def __str__(self):
         return str(self.value)
 
+    @staticmethod
+    @lru_cache(maxsize=1024, typed=True)
+    def of(value: str) -> 'Description':
+        return Description(value)
+
+
+def flyweight_stats() -> Dict[str, Any]:
+    return {cls.__name__: cls.of.cache_info() for cls in (Name, Manufacturer, Description, Quantity)}
+
 
 @typechecked
 @dataclass(frozen=True, order=True)
 class Username:
     value: str
+    validator = string_validator('value', r'[A-Za-z0-9]+', min_len=8, max_len=25)
 
+    @timed('validation.Username')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=8, max_len=25, custom=pattern(r'[A-Za-z0-9]+'))
+        self.validator(self.value)
 
     def __str__(self):
         return str(self.value)
@@ -129,11 +195,13 @@ class Username:
 @dataclass(frozen=True, order=True)
 class Email:
     value: str
+    validator = string_validator('value', r'[A-Za-z0-9]+[\.]*[A-Za-z]*@[A-Za-z]+\.[a-z]+', min_len=8,
+                                 max_len=25)
 
+    @timed('validation.Email')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=8, max_len=25,
-                 custom=pattern(r'[A-Za-z0-9]+[\.]*[A-Za-z]*@[A-Za-z]+\.[a-z]+'))
+        self.validator(self.value)
 
     def __str__(self):
         return str(self.value)
@@ -143,11 +211,13 @@ class Email:
 @dataclass(frozen=True, order=True)
 class Password:
     value: str
+    validator = string_validator('value', r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[@$!\#*?&])[A-Za-z\d@$!\#*?&]{6,}$',
+                                 min_len=6, max_len=25)
 
+    @timed('validation.Password')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('value', self.value, min_len=6, max_len=25,
-                 custom=pattern(r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[@$!\#*?&])[A-Za-z\d@$!\#*?&]{6,}$'))
+        self.validator(self.value)
 
     def __str__(self):
         return str(self.value)
@@ -170,6 +240,10 @@ class Smartphone:
     def category(self) -> str:
         return 'Smartphone'
 
+    @property
+    def key(self) -> ItemKey:
+        return self.category, self.name.value, self.manufacturer.value
+
 
 @typechecked
 @dataclass(frozen=True, order=True)
@@ -188,33 +262,95 @@ class Computer:
     def category(self) -> str:
         return 'Computer'
 
+    @property
+    def key(self) -> ItemKey:
+        return self.category, self.name.value, self.manufacturer.value
+
+
+@typechecked
+@dataclass(frozen=True)
+class ShoppingListView:
+    __items: List[Union[Smartphone, Computer]] = field(repr=False)
+    __range: range
+
+    def __len__(self) -> int:
+        return len(self.__range)
+
+    def __iter__(self) -> Iterator[Union[Smartphone, Computer]]:
+        items = self.__items
+        return (items[index] for index in self.__range)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Smartphone, Computer, 'ShoppingListView']:
+        if isinstance(index, slice):
+            return ShoppingListView(self.__items, self.__range[index])
+        return self.__items[self.__range[index]]
+
 
 @typechecked
 @dataclass(frozen=True)
 class ShoppingList:
     __items: List[Union[Smartphone, Computer]] = field(default_factory=list, init=False)
+    __index: ItemIndex = field(default_factory=ItemIndex, init=False)
+    __totals: Totals = field(default_factory=Totals, init=False)
+    __history: History = field(default_factory=History, init=False, repr=False)
+    __by_key: Dict[ItemKey, Union[Smartphone, Computer]] = field(default_factory=dict, init=False, repr=False)
 
     def items(self) -> int:
         return len(self.__items)
 
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __iter__(self) -> Iterator[Union[Smartphone, Computer]]:
+        return iter(self.__items)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Smartphone, Computer, ShoppingListView]:
+        if isinstance(index, slice):
+            return ShoppingListView(self.__items, range(len(self.__items))[index])
+        return self.item(index)
+
+    def iter_page(self, offset: int, limit: int) -> Iterator[Union[Smartphone, Computer]]:
+        validate('offset', offset, min_value=0)
+        validate('limit', limit, min_value=0)
+        return islice(self.__items, offset, offset + limit)
+
     def item(self, index: int) -> Union[Smartphone, Computer]:
-        validate('index', index, min_value=0, max_value=self.items() - 1)
+        if not 0 <= index < len(self.__items):
+            self.__invalid_index(index)
         return self.__items[index]
 
+    def __invalid_index(self, index: int) -> None:
+        validate('index', index, min_value=0, max_value=self.items() - 1)
+
     def clear(self) -> None:
         self.__items.clear()
+        self.__index.clear()
+        self.__by_key.clear()
+        self.__totals.clear()
+        self.__history.record(PersistentVector())
 
     def add_smartphone(self, smartphone: Smartphone) -> None:
         validate('items', self.items(), max_value=9)
         if self.there_are_duplicates(smartphone):
             raise ValueError
-        self.__items.append(smartphone)
+        self.__append(smartphone)
 
     def add_computer(self, computer: Computer) -> None:
         validate('items', self.items(), max_value=9)
         if self.there_are_duplicates(computer):
             raise ValueError
-        self.__items.append(computer)
+        self.__append(computer)
+
+    def __append(self, item: Union[Smartphone, Computer]) -> None:
+        self.__items.append(item)
+        self.__index.add(item)
+        self.__by_key[item.key] = item
+        self.__count(item, self.__totals.add)
+        self.__history.record(self.__history.current.append(item))
+
+    @staticmethod
+    def __count(item: Union[Smartphone, Computer], update: Callable[[str, str, int, int], None]) -> None:
+        update(item.category, item.manufacturer.value, item.price.value_in_cents, item.quantity.value)
 
     def there_are_duplicates(self, item) -> bool:
         for i in self.__items:
@@ -223,24 +359,89 @@ class ShoppingList:
         return False
 
     def remove_item(self, index: int) -> None:
-        validate('index', index, min_value=0, max_value=self.items() - 1)
+        if not 0 <= index < len(self.__items):
+            self.__invalid_index(index)
+        self.__index.remove(self.__items[index])
+        del self.__by_key[self.__items[index].key]
+        self.__count(self.__items[index], self.__totals.remove)
         del self.__items[index]
+        self.__history.record(self.__history.current.delete(index))
 
     def change_quantity(self, index: int, quantity: Quantity):
-        validate('index', index, min_value=0, max_value=self.items() - 1)
+        if not 0 <= index < len(self.__items):
+            self.__invalid_index(index)
         get_item = self.__items[index]
-        self.remove_item(index)
-        if get_item.category == "Smartphone":
-            self.__items.insert(index,
-                                Smartphone(get_item.name, get_item.manufacturer, get_item.price, quantity,
-                                           get_item.description))
-        else:
-            self.__items.insert(index,
-                                Computer(get_item.name, get_item.manufacturer, get_item.price, quantity,
-                                         get_item.description))
+        self.__count(get_item, self.__totals.remove)
+        self.__items[index] = replace(get_item, quantity=quantity)
+        self.__by_key[get_item.key] = self.__items[index]
+        self.__count(self.__items[index], self.__totals.add)
+        self.__history.record(self.__history.current.set(index, self.__items[index]))
+
+    def replace_all(self, items: Iterable[Union[Smartphone, Computer]]) -> None:
+        items = list(items)
+        validate('items', len(items), max_value=10)
+        self.__history.record(PersistentVector.of(items))
+        self.__restore(self.__history.current)
 
     def sort_by_manufacturer(self) -> None:
         self.__items.sort(key=lambda x: x.manufacturer)
+        self.__history.record(PersistentVector.of(self.__items))
 
     def sort_by_price(self) -> None:
         self.__items.sort(key=lambda x: x.price)
+        self.__history.record(PersistentVector.of(self.__items))
+
+    def can_undo(self) -> bool:
+        return self.__history.can_undo
+
+    def can_redo(self) -> bool:
+        return self.__history.can_redo
+
+    def undo(self) -> bool:
+        return self.__restore(self.__history.undo())
+
+    def redo(self) -> bool:
+        return self.__restore(self.__history.redo())
+
+    def forget_history(self) -> None:
+        self.__history.reset()
+
+    def __restore(self, version: Optional[PersistentVector]) -> bool:
+        if version is None:
+            return False
+        self.__items[:] = version
+        self.__index.clear()
+        self.__totals.clear()
+        self.__by_key.clear()
+        for item in self.__items:
+            self.__index.add(item)
+            self.__by_key[item.key] = item
+            self.__count(item, self.__totals.add)
+        return True
+
+    def filter(self, category: Optional[str] = None, manufacturer: Optional[Manufacturer] = None,
+               price_between: Optional[Tuple[Optional[Price], Optional[Price]]] = None,
+               name_prefix: Optional[str] = None) -> List[Union[Smartphone, Computer]]:
+        cents = None
+        if price_between is not None:
+            cents = tuple(price.value_in_cents if price is not None else None for price in price_between)
+        keys = self.__index.find(category, manufacturer.value if manufacturer is not None else None, cents,
+                                 name_prefix)
+        if keys is None:
+            return list(self.__items)
+        return [item for item in self.__items if item.key in keys]
+
+    def search(self, query: str, limit: int = 10) -> List[Union[Smartphone, Computer]]:
+        return [self.__by_key[key] for key in self.__index.search(query, limit)]
+
+    def total(self) -> Price:
+        return Price.from_cents(self.__totals.cents)
+
+    def total_quantity(self) -> int:
+        return self.__totals.quantity
+
+    def subtotals_by_category(self) -> Dict[str, Price]:
+        return {key: Price.from_cents(cents) for key, cents in self.__totals.by_category().items()}
+
+    def subtotals_by_manufacturer(self) -> Dict[str, Price]:
+        return {key: Price.from_cents(cents) for key, cents in self.__totals.by_manufacturer().items()}
@@ -0,0 +1,255 @@
+import heapq
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from validation.typechecking import typechecked
+
+ItemKey = Tuple[str, str, str]
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower())
+
+
+def trigrams(token: str) -> Set[str]:
+    padded = f'  {token} '
+    return {padded[start:start + 3] for start in range(len(padded) - 2)}
+
+
+@dataclass
+class _TrieNode:
+    children: Dict[str, '_TrieNode'] = field(default_factory=dict)
+    keys: Set[ItemKey] = field(default_factory=set)
+
+
+@typechecked
+@dataclass(frozen=True)
+class HashIndex:
+    __buckets: Dict[str, Set[ItemKey]] = field(default_factory=dict, init=False)
+
+    def add(self, value: str, key: ItemKey) -> None:
+        self.__buckets.setdefault(value, set()).add(key)
+
+    def remove(self, value: str, key: ItemKey) -> None:
+        bucket = self.__buckets[value]
+        bucket.discard(key)
+        if not bucket:
+            del self.__buckets[value]
+
+    def find(self, value: str) -> Set[ItemKey]:
+        return set(self.__buckets.get(value, ()))
+
+    def clear(self) -> None:
+        self.__buckets.clear()
+
+
+@typechecked
+@dataclass(frozen=True)
+class SortedIndex:
+    __entries: List[Tuple[int, ItemKey]] = field(default_factory=list, init=False)
+
+    def add(self, value: int, key: ItemKey) -> None:
+        insort(self.__entries, (value, key))
+
+    def remove(self, value: int, key: ItemKey) -> None:
+        del self.__entries[bisect_left(self.__entries, (value, key))]
+
+    def find(self, low: Optional[int] = None, high: Optional[int] = None) -> Set[ItemKey]:
+        start = 0 if low is None else bisect_left(self.__entries, (low,))
+        end = len(self.__entries) if high is None else bisect_left(self.__entries, (high + 1,))
+        return {key for _, key in self.__entries[start:end]}
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+
+@typechecked
+@dataclass(frozen=True)
+class PrefixTrie:
+    __root: _TrieNode = field(default_factory=_TrieNode, init=False)
+
+    def add(self, word: str, key: ItemKey) -> None:
+        node = self.__root
+        node.keys.add(key)
+        for char in word.lower():
+            node = node.children.setdefault(char, _TrieNode())
+            node.keys.add(key)
+
+    def remove(self, word: str, key: ItemKey) -> None:
+        node = self.__root
+        node.keys.discard(key)
+        for char in word.lower():
+            child = node.children[char]
+            child.keys.discard(key)
+            if not child.keys:
+                del node.children[char]
+                return
+            node = child
+
+    def find(self, prefix: str) -> Set[ItemKey]:
+        node = self.__root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return set(node.keys)
+
+    def clear(self) -> None:
+        self.__root.children.clear()
+        self.__root.keys.clear()
+
+
+@typechecked
+@dataclass(frozen=True)
+class TextIndex:
+    name_weight: float = 2.0
+    threshold: float = 0.4
+    __postings: Dict[str, Dict[float, Dict[ItemKey, None]]] = field(default_factory=dict, init=False, repr=False)
+    __tokens: Dict[ItemKey, Dict[str, float]] = field(default_factory=dict, init=False, repr=False)
+    __grams: Dict[str, Set[str]] = field(default_factory=dict, init=False, repr=False)
+    __gram_counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def add(self, key: ItemKey, name: str, description: str) -> None:
+        weights = dict.fromkeys(tokenize(description), 1.0)
+        weights.update(dict.fromkeys(tokenize(name), self.name_weight))
+        self.__tokens[key] = weights
+        for token, weight in weights.items():
+            postings = self.__postings.get(token)
+            if postings is None:
+                postings = self.__postings[token] = {}
+                grams = trigrams(token)
+                self.__gram_counts[token] = len(grams)
+                for gram in grams:
+                    self.__grams.setdefault(gram, set()).add(token)
+            postings.setdefault(weight, {})[key] = None
+
+    def remove(self, key: ItemKey) -> None:
+        for token, weight in self.__tokens.pop(key).items():
+            postings = self.__postings[token]
+            del postings[weight][key]
+            if not postings[weight]:
+                del postings[weight]
+            if postings:
+                continue
+            del self.__postings[token]
+            del self.__gram_counts[token]
+            for gram in trigrams(token):
+                tokens = self.__grams[gram]
+                tokens.discard(token)
+                if not tokens:
+                    del self.__grams[gram]
+
+    def __similar(self, token: str) -> Dict[str, float]:
+        grams = trigrams(token)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.__grams.get(gram, ()))
+        similar = {}
+        for candidate, common in shared.items():
+            similarity = 2 * common / (len(grams) + self.__gram_counts[candidate])
+            if similarity >= self.threshold:
+                similar[candidate] = similarity
+        return similar
+
+    def __stream(self, similar: Dict[str, float]) -> Iterator[Tuple[float, ItemKey]]:
+        buckets = sorted(((similarity * weight, keys) for token, similarity in similar.items()
+                          for weight, keys in self.__postings[token].items()), key=lambda bucket: -bucket[0])
+        for score, keys in buckets:
+            for key in keys:
+                yield score, key
+
+    def __score(self, key: ItemKey, matches: Dict[str, List[Tuple[int, float]]], width: int) -> float:
+        best = [0.0] * width
+        for token, weight in self.__tokens[key].items():
+            for position, similarity in matches.get(token, ()):
+                if similarity * weight > best[position]:
+                    best[position] = similarity * weight
+        return sum(best)
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[ItemKey, float]]:
+        similar = [similar for similar in map(self.__similar, dict.fromkeys(tokenize(query))) if similar]
+        if not similar or limit <= 0:
+            return []
+        matches: Dict[str, List[Tuple[int, float]]] = {}
+        for position, candidates in enumerate(similar):
+            for token, similarity in candidates.items():
+                matches.setdefault(token, []).append((position, similarity))
+        streams = [self.__stream(candidates) for candidates in similar]
+        bounds = [max(candidates.values()) * self.name_weight for candidates in similar]
+        best: List[Tuple[float, int, ItemKey]] = []
+        seen: Set[ItemKey] = set()
+        while any(bounds) and (len(best) < limit or best[0][0] < sum(bounds)):
+            for position, stream in enumerate(streams):
+                score, key = next(stream, (0.0, None))
+                bounds[position] = score
+                if key is None or key in seen:
+                    continue
+                seen.add(key)
+                entry = (self.__score(key, matches, len(similar)), -len(seen), key)
+                if len(best) < limit:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+        return [(key, score) for score, _, key in sorted(best, reverse=True)]
+
+    def clear(self) -> None:
+        self.__postings.clear()
+        self.__tokens.clear()
+        self.__grams.clear()
+        self.__gram_counts.clear()
+
+
+@typechecked
+@dataclass(frozen=True)
+class ItemIndex:
+    __by_category: HashIndex = field(default_factory=HashIndex, init=False)
+    __by_manufacturer: HashIndex = field(default_factory=HashIndex, init=False)
+    __by_price: SortedIndex = field(default_factory=SortedIndex, init=False)
+    __by_name: PrefixTrie = field(default_factory=PrefixTrie, init=False)
+    __by_text: TextIndex = field(default_factory=TextIndex, init=False)
+
+    def add(self, item: Any) -> None:
+        self.__by_category.add(item.category, item.key)
+        self.__by_manufacturer.add(item.manufacturer.value, item.key)
+        self.__by_price.add(item.price.value_in_cents, item.key)
+        self.__by_name.add(item.name.value, item.key)
+        self.__by_text.add(item.key, item.name.value, item.description.value)
+
+    def remove(self, item: Any) -> None:
+        self.__by_category.remove(item.category, item.key)
+        self.__by_manufacturer.remove(item.manufacturer.value, item.key)
+        self.__by_price.remove(item.price.value_in_cents, item.key)
+        self.__by_name.remove(item.name.value, item.key)
+        self.__by_text.remove(item.key)
+
+    def clear(self) -> None:
+        self.__by_category.clear()
+        self.__by_manufacturer.clear()
+        self.__by_price.clear()
+        self.__by_name.clear()
+        self.__by_text.clear()
+
+    def search(self, query: str, limit: int = 10) -> List[ItemKey]:
+        return [key for key, _ in self.__by_text.search(query, limit)]
+
+    def find(self, category: Optional[str] = None, manufacturer: Optional[str] = None,
+             price_between: Optional[Tuple[Optional[int], Optional[int]]] = None,
+             name_prefix: Optional[str] = None) -> Optional[Set[ItemKey]]:
+        candidates = []
+        if category is not None:
+            candidates.append(self.__by_category.find(category))
+        if manufacturer is not None:
+            candidates.append(self.__by_manufacturer.find(manufacturer))
+        if price_between is not None:
+            candidates.append(self.__by_price.find(*price_between))
+        if name_prefix:
+            candidates.append(self.__by_name.find(name_prefix))
+        if not candidates:
+            return None
+        candidates.sort(key=len)
+        return candidates[0].intersection(*candidates[1:])
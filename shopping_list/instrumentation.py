@@ -0,0 +1,106 @@
+import atexit
+import functools
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, TextIO, ContextManager, Optional
+
+ENV_VARIABLE = 'SHOPPING_LIST_STATS'
+
+
+@dataclass
+class Timing:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+@dataclass
+class Stats:
+    timings: Dict[str, Timing] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, name: str, seconds: float) -> None:
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Timing()
+        timing.add(seconds)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def reset(self) -> None:
+        self.timings.clear()
+        self.counters.clear()
+
+    def dump(self, file: Optional[TextIO] = None) -> None:
+        file = file or sys.stderr
+        print(f"{'TIMER':<40} {'COUNT':>8} {'TOTAL ms':>10} {'MEAN ms':>10} {'MAX ms':>10}", file=file)
+        for name, timing in sorted(self.timings.items()):
+            print(f'{name:<40} {timing.count:>8} {timing.total * 1000:>10.3f} '
+                  f'{timing.total / timing.count * 1000:>10.3f} {timing.max * 1000:>10.3f}', file=file)
+        if self.counters:
+            print(f"{'COUNTER':<40} {'VALUE':>8}", file=file)
+            for name, value in sorted(self.counters.items()):
+                print(f'{name:<40} {value:>8}', file=file)
+
+
+stats = Stats()
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_VARIABLE, '') not in ('', '0')
+
+
+_enabled = is_enabled()
+_disabled_timer = nullcontext()
+if _enabled:
+    atexit.register(stats.dump)
+
+
+@contextmanager
+def _timer(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.record(name, time.perf_counter() - start)
+
+
+def timer(name: str) -> ContextManager[None]:
+    return _timer(name) if _enabled else _disabled_timer
+
+
+def count(name: str, amount: int = 1) -> None:
+    if _enabled:
+        stats.increment(name, amount)
+
+
+def record(name: str, seconds: float) -> None:
+    if _enabled:
+        stats.record(name, seconds)
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    def decorator(function: Callable) -> Callable:
+        if not _enabled:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats.record(name, time.perf_counter() - start)
+
+        return wrapper
+
+    return decorator
@@ -1,21 +1,24 @@
 from dataclasses import dataclass, field, InitVar
 from typing import Callable, Optional, List, Dict, Any
 
-from typeguard import typechecked
+from validation.typechecking import typechecked
 from valid8 import validate
 
+from shopping_list.instrumentation import timed
 from validation.dataclasses import validate_dataclass
-from validation.regex import pattern
+from validation.regex import string_validator
 
 
 @typechecked
 @dataclass(order=True, frozen=True)
 class MenuDescription:
     value: str
+    validator = string_validator('MenuDescription.value', r'[0-9A-Za-z ;.,_-]*', min_len=1, max_len=1000)
 
+    @timed('validation.MenuDescription')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('MenuDescription.value', self.value, min_len=1, max_len=1000, custom=pattern(r'[0-9A-Za-z ;.,_-]*'))
+        self.validator(self.value)
 
     def __str__(self):
         return self.value
@@ -25,10 +28,12 @@ class MenuDescription:
 @dataclass(order=True, frozen=True)
 class Key:
     value: str
+    validator = string_validator('Key.value', r'[0-9A-Za-z_-]*', min_len=1, max_len=10)
 
+    @timed('validation.Key')
     def __post_init__(self):
         validate_dataclass(self)
-        validate('Key.value', self.value, min_len=1, max_len=10, custom=pattern(r'[0-9A-Za-z_-]*'))
+        self.validator(self.value)
 
     def __str__(self):
         return self.value
@@ -74,6 +79,7 @@ class Menu:
     def _has_exit(self) -> bool:
         return bool(list(filter(lambda e: e.is_exit, self.__entries)))
 
+    @timed('render.menu')
     def __print(self) -> None:
         length = len(str(self.description))
         fmt = '***{}{}{}***'
@@ -0,0 +1,181 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from valid8 import validate
+
+from validation.typechecking import typechecked
+
+
+@dataclass
+class _Node:
+    left: Optional['_Node']
+    item: Any
+    right: Optional['_Node']
+    size: int
+    height: int
+
+
+def _size(node: Optional[_Node]) -> int:
+    return node.size if node is not None else 0
+
+
+def _height(node: Optional[_Node]) -> int:
+    return node.height if node is not None else 0
+
+
+def _node(left: Optional[_Node], item: Any, right: Optional[_Node]) -> _Node:
+    return _Node(left, item, right, _size(left) + _size(right) + 1, max(_height(left), _height(right)) + 1)
+
+
+def _balance(left: Optional[_Node], item: Any, right: Optional[_Node]) -> _Node:
+    if _height(left) > _height(right) + 1:
+        if _height(left.left) < _height(left.right):
+            pivot = left.right
+            return _node(_node(left.left, left.item, pivot.left), pivot.item, _node(pivot.right, item, right))
+        return _node(left.left, left.item, _node(left.right, item, right))
+    if _height(right) > _height(left) + 1:
+        if _height(right.right) < _height(right.left):
+            pivot = right.left
+            return _node(_node(left, item, pivot.left), pivot.item, _node(pivot.right, right.item, right.right))
+        return _node(_node(left, item, right.left), right.item, right.right)
+    return _node(left, item, right)
+
+
+def _insert(node: Optional[_Node], index: int, item: Any) -> _Node:
+    if node is None:
+        return _node(None, item, None)
+    position = _size(node.left)
+    if index <= position:
+        return _balance(_insert(node.left, index, item), node.item, node.right)
+    return _balance(node.left, node.item, _insert(node.right, index - position - 1, item))
+
+
+def _pop_first(node: _Node) -> Tuple[Optional[_Node], Any]:
+    if node.left is None:
+        return node.right, node.item
+    left, first = _pop_first(node.left)
+    return _balance(left, node.item, node.right), first
+
+
+def _delete(node: _Node, index: int) -> Optional[_Node]:
+    position = _size(node.left)
+    if index < position:
+        return _balance(_delete(node.left, index), node.item, node.right)
+    if index > position:
+        return _balance(node.left, node.item, _delete(node.right, index - position - 1))
+    if node.right is None:
+        return node.left
+    right, successor = _pop_first(node.right)
+    return _balance(node.left, successor, right)
+
+
+def _set(node: _Node, index: int, item: Any) -> _Node:
+    position = _size(node.left)
+    if index < position:
+        return _Node(_set(node.left, index, item), node.item, node.right, node.size, node.height)
+    if index > position:
+        return _Node(node.left, node.item, _set(node.right, index - position - 1, item), node.size, node.height)
+    return _Node(node.left, item, node.right, node.size, node.height)
+
+
+def _build(items: List[Any], start: int, end: int) -> Optional[_Node]:
+    if start >= end:
+        return None
+    middle = (start + end) // 2
+    return _node(_build(items, start, middle), items[middle], _build(items, middle + 1, end))
+
+
+@typechecked
+@dataclass(frozen=True)
+class PersistentVector:
+    __root: Optional[_Node] = None
+
+    @staticmethod
+    def of(items: Iterable[Any]) -> 'PersistentVector':
+        items = list(items)
+        return PersistentVector(_build(items, 0, len(items)))
+
+    def __len__(self) -> int:
+        return _size(self.__root)
+
+    def __iter__(self) -> Iterator[Any]:
+        stack, node = [], self.__root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item
+            node = node.right
+
+    def __getitem__(self, index: int) -> Any:
+        self.__check(index, len(self) - 1)
+        node = self.__root
+        while True:
+            position = _size(node.left)
+            if index == position:
+                return node.item
+            if index < position:
+                node = node.left
+            else:
+                index -= position + 1
+                node = node.right
+
+    def append(self, item: Any) -> 'PersistentVector':
+        return PersistentVector(_insert(self.__root, len(self), item))
+
+    def insert(self, index: int, item: Any) -> 'PersistentVector':
+        self.__check(index, len(self))
+        return PersistentVector(_insert(self.__root, index, item))
+
+    def set(self, index: int, item: Any) -> 'PersistentVector':
+        self.__check(index, len(self) - 1)
+        return PersistentVector(_set(self.__root, index, item))
+
+    def delete(self, index: int) -> 'PersistentVector':
+        self.__check(index, len(self) - 1)
+        return PersistentVector(_delete(self.__root, index))
+
+    @staticmethod
+    def __check(index: int, last: int) -> None:
+        if not 0 <= index <= last:
+            validate('index', index, min_value=0, max_value=last)
+
+
+@typechecked
+@dataclass
+class History:
+    current: PersistentVector = field(default_factory=PersistentVector)
+    __undo: List[PersistentVector] = field(default_factory=list, init=False, repr=False)
+    __redo: List[PersistentVector] = field(default_factory=list, init=False, repr=False)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self.__undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self.__redo)
+
+    def record(self, version: PersistentVector) -> None:
+        self.__undo.append(self.current)
+        self.__redo.clear()
+        self.current = version
+
+    def undo(self) -> Optional[PersistentVector]:
+        if not self.__undo:
+            return None
+        self.__redo.append(self.current)
+        self.current = self.__undo.pop()
+        return self.current
+
+    def redo(self) -> Optional[PersistentVector]:
+        if not self.__redo:
+            return None
+        self.__undo.append(self.current)
+        self.current = self.__redo.pop()
+        return self.current
+
+    def reset(self) -> None:
+        self.__undo.clear()
+        self.__redo.clear()
@@ -0,0 +1,90 @@
+import cProfile
+import pstats
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TextIO, Tuple
+
+SUBSYSTEMS: List[Tuple[str, Tuple[str, ...]]] = [
+    ('validation', ('valid8', 'typeguard', 'dataclass_type_validator', 'validation/')),
+    ('network', ('requests/', 'urllib3/', 'http/', 'socket.py', 'ssl.py', 'json/', 'charset_normalizer/',
+                 'idna/', 'certifi/')),
+    ('menu', ('shopping_list/menu.py',)),
+    ('domain', ('shopping_list/domain.py', 'shopping_list/index.py', 'shopping_list/totals.py')),
+    ('app', ('shopping_list/',)),
+]
+
+
+def subsystem(filename: str) -> str:
+    filename = filename.replace('\\', '/')
+    for name, markers in SUBSYSTEMS:
+        if any(marker in filename for marker in markers):
+            return name
+    return 'other'
+
+
+def _function_subsystem(function: Tuple[str, int, str], entries: Dict, seen: Optional[set] = None) -> str:
+    filename = function[0]
+    if filename != '~':
+        return subsystem(filename)
+    seen = seen or set()
+    seen.add(function)
+    callers = entries[function][4]
+    for caller in sorted(callers, key=lambda c: -callers[c][3]):
+        if caller not in seen and caller in entries:
+            return _function_subsystem(caller, entries, seen)
+    return 'other'
+
+
+def report_profile(stats: pstats.Stats, file: TextIO, top: int = 5) -> None:
+    entries = stats.stats
+    totals: Dict[str, float] = {}
+    functions: Dict[str, List[Tuple[float, str]]] = {}
+    for function, (_, calls, own_time, _, _) in entries.items():
+        name = _function_subsystem(function, entries)
+        totals[name] = totals.get(name, 0.0) + own_time
+        label = f'{function[2]} ({Path(function[0]).name}:{function[1]})' if function[0] != '~' else function[2]
+        functions.setdefault(name, []).append((own_time, f'{label} x{calls}'))
+    overall = sum(totals.values()) or 1.0
+    print(f"{'SUBSYSTEM':<12} {'OWN TIME s':>12} {'SHARE':>8}", file=file)
+    for name, seconds in sorted(totals.items(), key=lambda entry: -entry[1]):
+        print(f'{name:<12} {seconds:>12.4f} {seconds / overall:>8.1%}', file=file)
+        for own_time, label in sorted(functions[name], reverse=True)[:top]:
+            print(f'    {own_time:>10.4f}  {label}', file=file)
+
+
+def report_memory(snapshot: tracemalloc.Snapshot, file: TextIO, top: int = 5) -> None:
+    totals: Dict[str, int] = {}
+    lines: Dict[str, List[tracemalloc.Statistic]] = {}
+    for statistic in snapshot.statistics('lineno'):
+        name = subsystem(statistic.traceback[0].filename)
+        totals[name] = totals.get(name, 0) + statistic.size
+        lines.setdefault(name, []).append(statistic)
+    print(f"{'SUBSYSTEM':<12} {'KiB':>12} {'BLOCKS':>8}", file=file)
+    for name, size in sorted(totals.items(), key=lambda entry: -entry[1]):
+        print(f'{name:<12} {size / 1024:>12.1f} {sum(s.count for s in lines[name]):>8}', file=file)
+        for statistic in lines[name][:top]:
+            frame = statistic.traceback[0]
+            print(f'    {statistic.size / 1024:>10.1f}  {Path(frame.filename).name}:{frame.lineno}', file=file)
+
+
+def profile(function: Callable[[], None], output: Path, file: Optional[TextIO] = None) -> None:
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(function)
+    finally:
+        profiler.dump_stats(str(output))
+        report_profile(pstats.Stats(profiler), file or sys.stderr)
+
+
+def trace_memory(function: Callable[[], None], output: Path, file: Optional[TextIO] = None) -> None:
+    tracemalloc.start(25)
+    try:
+        function()
+    finally:
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ])
+        tracemalloc.stop()
+        snapshot.dump(str(output))
+        report_memory(snapshot, file or sys.stderr)
@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional
+
+from valid8 import validate
+
+from shopping_list.index import ItemKey
+from validation.typechecking import typechecked
+
+FIELDS = ('price', 'quantity', 'description')
+
+
+@typechecked
+@dataclass(frozen=True)
+class Diff:
+    added: List[Any] = field(default_factory=list)
+    edited: List[Any] = field(default_factory=list)
+    deleted: List[ItemKey] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.edited) + len(self.deleted)
+
+
+@typechecked
+@dataclass(frozen=True)
+class Conflict:
+    key: ItemKey
+    local: Any
+    remote: Any
+    resolved: Any
+
+
+@typechecked
+@dataclass(frozen=True)
+class Merge:
+    items: List[Any]
+    conflicts: List[Conflict] = field(default_factory=list)
+
+
+def by_key(items: Iterable[Any]) -> Dict[ItemKey, Any]:
+    return {item.key: item for item in items}
+
+
+def diff(source: Iterable[Any], target: Iterable[Any]) -> Diff:
+    before = source if isinstance(source, dict) else by_key(source)
+    after = target if isinstance(target, dict) else by_key(target)
+    added, edited = [], []
+    for key, item in after.items():
+        old = before.get(key)
+        if old is None:
+            added.append(item)
+        elif old is not item and old != item:
+            edited.append(item)
+    return Diff(added, edited, [key for key in before if key not in after])
+
+
+def _merge_fields(base: Any, local: Any, remote: Any) -> Optional[Any]:
+    changes = {}
+    for name in FIELDS:
+        base_value, local_value, remote_value = (getattr(item, name) for item in (base, local, remote))
+        if local_value == remote_value or remote_value == base_value:
+            changes[name] = local_value
+        elif local_value == base_value:
+            changes[name] = remote_value
+        else:
+            return None
+    return replace(local, **changes)
+
+
+def merge(base: Iterable[Any], local: Iterable[Any], remote: Iterable[Any], prefer: str = 'local') -> Merge:
+    validate('prefer', prefer, is_in={'local', 'remote'})
+    base, local, remote = by_key(base), by_key(local), by_key(remote)
+    items, conflicts = [], []
+    for key in {**local, **remote}:
+        old, mine, theirs = base.get(key), local.get(key), remote.get(key)
+        if mine is theirs or theirs is old or mine == theirs or theirs == old:
+            chosen = mine
+        elif mine is old or mine == old:
+            chosen = theirs
+        else:
+            chosen = None
+            if old is not None and mine is not None and theirs is not None:
+                chosen = _merge_fields(old, mine, theirs)
+            if chosen is None:
+                chosen = mine if prefer == 'local' else theirs
+                conflicts.append(Conflict(key, mine, theirs, chosen))
+        if chosen is not None:
+            items.append(chosen)
+    return Merge(items, conflicts)
@@ -0,0 +1,120 @@
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import requests
+import requests.api
+
+from validation.typechecking import typechecked
+
+REDACTED = '***'
+SECRET_FIELDS = frozenset({'password', 'password1', 'password2', 'key'})
+
+
+class ReplayError(Exception):
+    pass
+
+
+@typechecked
+@dataclass(frozen=True)
+class Exchange:
+    method: str
+    url: str
+    payload: Optional[Union[Dict[str, Any], List[Any]]]
+    status: int
+    body: str
+    latency: float
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @staticmethod
+    def from_json(line: str) -> 'Exchange':
+        return Exchange(**json.loads(line))
+
+    def response(self) -> requests.Response:
+        res = requests.Response()
+        res.status_code = self.status
+        res.url = self.url
+        res.headers.update(self.headers)
+        res.encoding = 'utf-8'
+        res._content = self.body.encode('utf-8')
+        return res
+
+
+def _payload(kwargs: Dict[str, Any]) -> Optional[Union[Dict[str, Any], List[Any]]]:
+    payload = kwargs.get('data')
+    return _plain(kwargs.get('json') if payload is None else payload)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(key): REDACTED if key in SECRET_FIELDS else _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value if value is None or isinstance(value, (str, int, float)) else str(value)
+
+
+def _body(text: str) -> str:
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    plain = _plain(data)
+    return text if plain == data else json.dumps(plain)
+
+
+def load(path: Path) -> List[Exchange]:
+    with open(path, encoding='utf-8') as file:
+        return [Exchange.from_json(line) for line in file if line.strip()]
+
+
+@contextmanager
+def record(path: Path) -> Iterator[List[Exchange]]:
+    exchanges = []
+    original_request = requests.api.request
+
+    def recording_request(method, url, **kwargs):
+        start = time.perf_counter()
+        res = original_request(method, url, **kwargs)
+        exchange = Exchange(method.upper(), url, _payload(kwargs), res.status_code, _body(res.text),
+                            time.perf_counter() - start, dict(res.headers))
+        file.write(exchange.to_json() + '\n')
+        file.flush()
+        exchanges.append(exchange)
+        return res
+
+    with open(path, 'w', encoding='utf-8') as file:
+        requests.api.request = recording_request
+        try:
+            yield exchanges
+        finally:
+            requests.api.request = original_request
+
+
+@contextmanager
+def replay(path: Path, realtime: bool = False) -> Iterator[List[Exchange]]:
+    exchanges = load(path)
+    pending = iter(exchanges)
+    original_request = requests.api.request
+
+    def replaying_request(method, url, **kwargs):
+        exchange = next(pending, None)
+        if exchange is None:
+            raise ReplayError(f'No recorded response left for {method.upper()} {url}')
+        if (exchange.method, exchange.url, exchange.payload) != (method.upper(), url, _payload(kwargs)):
+            raise ReplayError(f'Expected {exchange.method} {exchange.url} {exchange.payload}, '
+                             f'got {method.upper()} {url} {_payload(kwargs)}')
+        if realtime:
+            time.sleep(exchange.latency)
+        return exchange.response()
+
+    requests.api.request = replaying_request
+    try:
+        yield exchanges
+    finally:
+        requests.api.request = original_request
@@ -0,0 +1,55 @@
+import random
+import threading
+from typing import Any, Callable, Optional
+
+from shopping_list.instrumentation import count
+
+
+class Refresher:
+    def __init__(self, job: Callable[[], Any], interval: float, jitter: float = 0.0,
+                 rng: Optional[random.Random] = None):
+        if interval <= 0 or jitter < 0:
+            raise ValueError('the refresh interval must be positive and the jitter not negative')
+        self.__job = job
+        self.__interval = interval
+        self.__jitter = jitter
+        self.__rng = rng or random.Random()
+        self.__stopped = threading.Event()
+        self.__lock = threading.Lock()
+        self.__latest: Optional[Any] = None
+        self.__thread = threading.Thread(target=self.__refresh, name='shopping-list-refresh', daemon=True)
+
+    def delay(self) -> float:
+        return max(0.0, self.__interval + self.__rng.uniform(-self.__jitter, self.__jitter))
+
+    def start(self) -> 'Refresher':
+        self.__thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        self.__stopped.set()
+        if self.__thread.is_alive():
+            self.__thread.join(timeout)
+        return not self.__thread.is_alive()
+
+    def __enter__(self) -> 'Refresher':
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def take(self) -> Optional[Any]:
+        with self.__lock:
+            latest, self.__latest = self.__latest, None
+        return latest
+
+    def __refresh(self) -> None:
+        while not self.__stopped.wait(self.delay()):
+            try:
+                result = self.__job()
+            except Exception:
+                count('refresh.failures')
+                continue
+            count('refresh.runs')
+            with self.__lock:
+                self.__latest = result
@@ -0,0 +1,137 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from shopping_list.instrumentation import count, timer
+from validation.typechecking import typechecked
+
+Timeout = Tuple[float, float]
+
+TIMEOUTS: Dict[str, Timeout] = {
+    'http.login': (3.05, 10.0),
+    'http.register': (3.05, 10.0),
+    'http.fetch': (3.05, 20.0),
+    'http.save': (3.05, 10.0),
+    'http.update': (3.05, 10.0),
+    'http.delete': (3.05, 10.0),
+    'http.batch': (3.05, 30.0),
+}
+DEFAULT_TIMEOUT: Timeout = (3.05, 10.0)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+@typechecked
+@dataclass
+class CircuitBreaker:
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    failures: int = field(default=0, init=False)
+    opened_at: Optional[float] = field(default=None, init=False)
+    __probing: bool = field(default=False, init=False, repr=False)
+    __lock: Any = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
+
+    @property
+    def state(self) -> str:
+        opened_at = self.opened_at
+        if opened_at is None:
+            return 'closed'
+        return 'half-open' if self.clock() - opened_at >= self.reset_timeout else 'open'
+
+    def allow(self) -> bool:
+        with self.__lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self.__probing:
+                self.__probing = True
+                return True
+        count('http.breaker.rejected')
+        return False
+
+    def record_success(self) -> None:
+        with self.__lock:
+            self.failures = 0
+            self.opened_at = None
+            self.__probing = False
+
+    def release(self) -> None:
+        with self.__lock:
+            self.__probing = False
+
+    def record_failure(self) -> None:
+        with self.__lock:
+            self.failures += 1
+            tripped = self.__probing or (self.opened_at is None and self.failures >= self.failure_threshold)
+            if tripped:
+                self.opened_at = self.clock()
+            self.__probing = False
+        if tripped:
+            count('http.breaker.trips')
+
+
+@typechecked
+@dataclass
+class Backoff:
+    attempts: int = 3
+    base: float = 0.1
+    cap: float = 5.0
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def delay(self, previous: float, retry_after: Optional[float] = None) -> float:
+        jittered = min(self.cap, self.rng.uniform(self.base, max(self.base, previous * 3)))
+        return max(jittered, retry_after) if retry_after is not None else jittered
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    try:
+        return max(0.0, float(response.headers.get('Retry-After')))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+@typechecked
+@dataclass
+class Resilience:
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    backoff: Backoff = field(default_factory=Backoff)
+    timeouts: Dict[str, Timeout] = field(default_factory=lambda: dict(TIMEOUTS))
+
+    def call(self, endpoint: str, send: Callable[[Timeout], Any], idempotent: bool = False) -> Any:
+        import requests
+
+        attempts = self.backoff.attempts if idempotent else 1
+        delay = self.backoff.base
+        for attempt in range(1, attempts + 1):
+            if not self.breaker.allow():
+                raise CircuitOpenError(f'Circuit open, {endpoint} not sent')
+            try:
+                with timer(endpoint):
+                    response = send(self.timeouts.get(endpoint, DEFAULT_TIMEOUT))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if isinstance(e, requests.Timeout):
+                    count('http.timeouts')
+                self.breaker.record_failure()
+                if attempt == attempts:
+                    raise
+                retry_after = None
+            except BaseException:
+                self.breaker.release()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    self.breaker.record_success()
+                    return response
+                self.breaker.record_failure()
+                retry_after = _retry_after(response)
+                if attempt == attempts or (retry_after is not None and retry_after > self.backoff.cap):
+                    return response
+            count('http.retries')
+            delay = self.backoff.delay(delay, retry_after)
+            time.sleep(delay)
@@ -0,0 +1,49 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+PATH_VARIABLE = 'SHOPPING_LIST_TOKEN_FILE'
+MAX_AGE_VARIABLE = 'SHOPPING_LIST_TOKEN_MAX_AGE'
+DEFAULT_PATH = Path.home() / '.shopping_list' / 'token'
+DEFAULT_MAX_AGE = 7 * 24 * 60 * 60
+
+
+def path() -> Path:
+    return Path(os.environ.get(PATH_VARIABLE) or DEFAULT_PATH)
+
+
+def max_age() -> float:
+    return float(os.environ.get(MAX_AGE_VARIABLE) or DEFAULT_MAX_AGE)
+
+
+def load() -> Optional[str]:
+    file = path()
+    try:
+        if os.name == 'posix' and file.stat().st_mode & 0o077:
+            return None
+        content = json.loads(file.read_text(encoding='utf-8'))
+        key, created = str(content['key']), float(content['created'])
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+    if not 0 <= time.time() - created <= max_age():
+        clear()
+        return None
+    return key
+
+
+def save(key: str) -> None:
+    file = path()
+    file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    descriptor = os.open(file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, 'w', encoding='utf-8') as out:
+        os.chmod(file, 0o600)
+        json.dump({'key': key, 'created': time.time()}, out)
+
+
+def clear() -> None:
+    try:
+        path().unlink()
+    except FileNotFoundError:
+        pass
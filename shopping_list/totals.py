@@ -0,0 +1,46 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from validation.typechecking import typechecked
+
+
+@typechecked
+@dataclass
+class Totals:
+    items: int = field(default=0, init=False)
+    quantity: int = field(default=0, init=False)
+    cents: int = field(default=0, init=False)
+    __by_category: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False)
+    __by_manufacturer: Dict[str, List[int]] = field(default_factory=dict, init=False, repr=False)
+
+    def add(self, category: str, manufacturer: str, price_in_cents: int, quantity: int) -> None:
+        self.__update(category, manufacturer, price_in_cents * quantity, quantity, 1)
+
+    def remove(self, category: str, manufacturer: str, price_in_cents: int, quantity: int) -> None:
+        self.__update(category, manufacturer, -price_in_cents * quantity, -quantity, -1)
+
+    def clear(self) -> None:
+        self.items = self.quantity = self.cents = 0
+        self.__by_category.clear()
+        self.__by_manufacturer.clear()
+
+    def by_category(self) -> Dict[str, int]:
+        return {key: bucket[0] for key, bucket in sorted(self.__by_category.items())}
+
+    def by_manufacturer(self) -> Dict[str, int]:
+        return {key: bucket[0] for key, bucket in sorted(self.__by_manufacturer.items())}
+
+    def __update(self, category: str, manufacturer: str, cents: int, quantity: int, items: int) -> None:
+        self.items += items
+        self.quantity += quantity
+        self.cents += cents
+        self.__update_bucket(self.__by_category, category, cents, items)
+        self.__update_bucket(self.__by_manufacturer, manufacturer, cents, items)
+
+    @staticmethod
+    def __update_bucket(buckets: Dict[str, List[int]], key: str, cents: int, items: int) -> None:
+        bucket = buckets.setdefault(key, [0, 0])
+        bucket[0] += cents
+        bucket[1] += items
+        if not bucket[1]:
+            del buckets[key]
@@ -0,0 +1,29 @@
+import pytest
+
+from benchmarks import harness
+
+
+def test_benchmark_registration_and_run():
+    harness.benchmark('test.harness.noop')(lambda: lambda: None)
+    results = harness.run('test.harness.*', repeat=1)
+    assert [result.name for result in results] == ['test.harness.noop']
+    assert results[0].calls > 0
+    assert results[0].seconds_per_call >= 0
+
+
+def test_benchmark_names_are_unique():
+    harness.benchmark('test.harness.unique')(lambda: lambda: None)
+    with pytest.raises(ValueError):
+        harness.benchmark('test.harness.unique')(lambda: lambda: None)
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / 'results.json'
+    harness.save([harness.Result('a', 0.5, 10)], path)
+    assert harness.load(path) == {'a': 0.5}
+
+
+def test_compare_reports_only_regressions_over_threshold():
+    baseline = {'fast': 1.0, 'slow': 1.0, 'same': 1.0}
+    current = {'fast': 0.5, 'slow': 1.5, 'same': 1.1, 'new': 3.0}
+    assert harness.compare(current, baseline, 0.2) == {'slow': 1.5}
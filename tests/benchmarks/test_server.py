@@ -0,0 +1,164 @@
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+import requests.api
+
+import shopping_list.app
+from benchmarks.server import StandInServer
+from shopping_list import instrumentation
+from shopping_list.app import App
+from shopping_list.instrumentation import stats
+
+
+@pytest.fixture
+def server():
+    with StandInServer() as server:
+        server.add_user('ciccioRiccio99', 'ciccioRiccio9!')
+        yield server
+
+
+def login(server):
+    res = requests.post(url=f'{server.url}auth/login/', data={'username': 'ciccioRiccio99',
+                                                              'password': 'ciccioRiccio9!'})
+    assert res.status_code == 200
+    return {'Authorization': f"Token {res.json()['key']}"}
+
+
+def test_server_rejects_wrong_credentials(server):
+    res = requests.post(url=f'{server.url}auth/login/', data={'username': 'ciccioRiccio99', 'password': 'x'})
+    assert res.status_code == 400
+
+
+def test_server_requires_token(server):
+    assert requests.get(url=f'{server.url}shopping-list/').status_code == 401
+
+
+def test_server_registration(server):
+    data = {'username': 'marioRossi99', 'email': 'mario@rossi.it', 'password1': 'Mario99!', 'password2': 'Mario99!'}
+    assert requests.post(url=f'{server.url}auth/registration/', data=data).status_code == 201
+    assert requests.post(url=f'{server.url}auth/registration/', data=data).status_code == 400
+
+
+def test_server_shopping_list_crud(server):
+    headers = login(server)
+    item = {'name': 'Pixel', 'category': 'Smartphone', 'manufacturer': 'Google', 'price': 97320, 'quantity': 1,
+            'description': ''}
+    res = requests.post(url=f'{server.url}shopping-list/add/', headers=headers, data=item)
+    assert res.status_code == 201
+    item_id = res.json()['id']
+    assert requests.get(url=f'{server.url}shopping-list/', headers=headers).json() == [{**item, 'id': item_id}]
+
+    requests.patch(url=f'{server.url}shopping-list/edit/{item_id}', headers=headers, data={'quantity': 3})
+    assert server.items('ciccioRiccio99')[0]['quantity'] == 3
+
+    assert requests.delete(url=f'{server.url}shopping-list/edit/{item_id}', headers=headers).status_code == 204
+    assert requests.delete(url=f'{server.url}shopping-list/edit/{item_id}', headers=headers).status_code == 404
+    assert server.items('ciccioRiccio99') == []
+
+
+def test_server_batch(server):
+    headers = login(server)
+    item = {'name': 'Pixel', 'category': 'Smartphone', 'manufacturer': 'Google', 'price': 97320, 'quantity': 1,
+            'description': ''}
+    item_id = server.add_item('ciccioRiccio99', dict(item, name='Pixel 2'))
+    res = requests.post(url=f'{server.url}shopping-list/batch/', headers=headers,
+                        json=[{'op': 'add', 'item': item}, {'op': 'edit', 'id': item_id, 'item': {'quantity': 2}},
+                              {'op': 'delete', 'id': item_id}, {'op': 'delete', 'id': item_id}, {'op': 'merge'}])
+    assert res.status_code == 200
+    results = res.json()
+    assert [result['status'] for result in results] == [201, 200, 204, 404, 400]
+    assert results[1]['body']['quantity'] == 2
+    assert server.items('ciccioRiccio99') == [{**item, 'id': results[0]['body']['id']}]
+
+    assert requests.post(url=f'{server.url}shopping-list/batch/', headers=headers, json={}).status_code == 400
+
+
+def test_server_conditional_gzip_get(server):
+    headers = login(server)
+    server.add_item('ciccioRiccio99', {'name': 'Pixel', 'category': 'Smartphone', 'manufacturer': 'Google',
+                                       'price': 97320, 'quantity': 1, 'description': ''})
+    res = requests.get(url=f'{server.url}shopping-list/', headers={**headers, 'Accept-Encoding': 'gzip'})
+    assert res.headers['Content-Encoding'] == 'gzip'
+    assert res.json()[0]['name'] == 'Pixel'
+    etag = res.headers['ETag']
+
+    res = requests.get(url=f'{server.url}shopping-list/', headers={**headers, 'If-None-Match': etag})
+    assert res.status_code == 304 and res.content == b''
+
+    server.add_item('ciccioRiccio99', {'name': 'Pixel 2', 'category': 'Smartphone', 'manufacturer': 'Google',
+                                       'price': 97320, 'quantity': 1, 'description': ''})
+    res = requests.get(url=f'{server.url}shopping-list/', headers={**headers, 'If-None-Match': etag})
+    assert res.status_code == 200 and res.headers['ETag'] != etag
+
+
+def test_server_error_injection():
+    with StandInServer(error_rate=1.0) as server:
+        assert requests.post(url=f'{server.url}auth/login/', data={}).status_code == 500
+
+
+@patch('builtins.input', side_effect=['1', 'ciccioRiccio99', 'ciccioRiccio9!', '4', '1', '5', '0', '0'])
+@patch('builtins.print')
+def test_app_against_server(mocked_print, mocked_input, server):
+    server.add_item('ciccioRiccio99', {'name': 'Pixel', 'category': 'Smartphone', 'manufacturer': 'Google',
+                                       'price': 97320, 'quantity': 1, 'description': ''})
+    with patch.object(shopping_list.app, 'api_server', server.url):
+        App().run()
+    mocked_print.assert_any_call('Quantity changed!')
+    assert server.items('ciccioRiccio99')[0]['quantity'] == 5
+
+
+@patch('builtins.input', side_effect=['1', 'ciccioRiccio99', 'ciccioRiccio9!', '0',
+                                      '1', 'ciccioRiccio99', 'ciccioRiccio9!', '0', '0'])
+@patch('builtins.print')
+def test_app_reuses_list_when_not_modified(mocked_print, mocked_input, server):
+    server.add_item('ciccioRiccio99', {'name': 'Pixel', 'category': 'Smartphone', 'manufacturer': 'Google',
+                                       'price': 97320, 'quantity': 1, 'description': ''})
+    statuses = []
+    original_request = requests.api.request
+
+    def request(method, url, **kwargs):
+        res = original_request(method, url, **kwargs)
+        statuses.append((method, res.status_code))
+        return res
+
+    stats.reset()
+    with patch.object(shopping_list.app, 'api_server', server.url), patch('requests.api.request', request), \
+            patch.object(instrumentation, '_enabled', True):
+        App().run()
+    assert [status for method, status in statuses if method == 'get'] == [200, 304]
+    assert stats.counters['http.fetch.not_modified'] == 1
+    assert 0 < stats.counters['http.fetch.bytes'] < stats.counters['http.fetch.bytes_decoded']
+    assert stats.timings['http.fetch.saved'].count == 1
+    stats.reset()
+    assert len([args for args, _ in mocked_print.call_args_list if 'Pixel' in str(args)]) == 2
+
+
+@patch('builtins.print')
+def test_app_refreshes_changes_from_other_devices(mocked_print, server):
+    refreshed = []
+    original_request = requests.api.request
+
+    def request(method, url, **kwargs):
+        res = original_request(method, url, **kwargs)
+        refreshed.append(method == 'get' and res.status_code == 200)
+        return res
+
+    def wait_for_refresh():
+        server.add_item('ciccioRiccio99', {'name': 'Pixel', 'category': 'Smartphone', 'manufacturer': 'Google',
+                                           'price': 97320, 'quantity': 1, 'description': ''})
+        del refreshed[:]
+        for _ in range(500):
+            if any(refreshed):
+                return '5'
+            time.sleep(0.01)
+        pytest.fail('the list was not refreshed')
+
+    inputs = iter([lambda: '1', lambda: 'ciccioRiccio99', lambda: 'ciccioRiccio9!', wait_for_refresh,
+                   lambda: '0', lambda: '0'])
+    with patch.object(shopping_list.app, 'api_server', server.url), patch('requests.api.request', request), \
+            patch('builtins.input', side_effect=lambda prompt: next(inputs)()):
+        App(refresh=0.01, refresh_jitter=0.005).run()
+    totals = [args[0] for args, _ in mocked_print.call_args_list if str(args[0]).startswith('TOTAL')]
+    assert totals == ['TOTAL: 0.00 (0 items, 0 pieces)', 'TOTAL: 973.20 (1 items, 1 pieces)']
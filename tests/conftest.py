@@ -0,0 +1,11 @@
+import pytest
+
+from shopping_list import token_cache
+
+
+@pytest.fixture(autouse=True)
+def token_file(tmp_path, monkeypatch):
+    path = tmp_path / 'token'
+    monkeypatch.setenv(token_cache.PATH_VARIABLE, str(path))
+    monkeypatch.delenv(token_cache.MAX_AGE_VARIABLE, raising=False)
+    return path
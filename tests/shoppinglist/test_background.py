@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from shopping_list.background import BackgroundLoop
+
+
+@pytest.fixture
+def background():
+    with BackgroundLoop() as background:
+        yield background
+
+
+def test_jobs_run_in_order_off_the_calling_thread(background):
+    done = []
+    background.submit('first', lambda: done.append(('first', threading.current_thread())))
+    background.submit('second', lambda: done.append(('second', threading.current_thread())))
+    assert background.wait(5)
+    assert [name for name, _ in done] == ['first', 'second']
+    assert all(thread is not threading.current_thread() for _, thread in done)
+    assert background.failures() == []
+
+
+def test_submit_does_not_block(background):
+    release = threading.Event()
+    background.submit('slow', lambda: release.wait(5))
+    assert not background.wait(0.01)
+    release.set()
+    assert background.wait(5)
+
+
+def test_failures_are_collected_once(background):
+    undone = []
+
+    def fail():
+        raise RuntimeError('offline')
+
+    background.submit('Add Pixel', fail, lambda: undone.append('Pixel'))
+    background.submit('Add Mac', lambda: None, lambda: undone.append('Mac'))
+    background.wait(5)
+    failures = background.failures()
+    assert [(failure.description, str(failure.error)) for failure in failures] == [('Add Pixel', 'offline')]
+    failures[0].undo()
+    assert undone == ['Pixel']
+    assert background.failures() == []
+
+
+def test_stop_waits_for_pending_jobs():
+    done = []
+    background = BackgroundLoop().start()
+    background.submit('job', lambda: done.append(1))
+    assert background.stop(5) == 0
+    assert done == [1]
+    assert background.loop.is_closed()
+
+
+def test_any_exception_is_a_failure(background):
+    def exhausted():
+        raise StopIteration
+
+    background.submit('exhausted', exhausted)
+    assert background.wait(5)
+    assert isinstance(background.failures()[0].error, StopIteration)
+    assert background.pending == 0
+
+
+def test_stop_is_bounded():
+    release = threading.Event()
+    background = BackgroundLoop().start()
+    background.submit('slow', lambda: release.wait(5))
+    assert background.stop(0.05) == 1
+    release.set()
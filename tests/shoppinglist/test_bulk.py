@@ -0,0 +1,59 @@
+import pytest
+
+from shopping_list.bulk import validate_columns, build_items
+from shopping_list.domain import Smartphone, Computer, Name, Manufacturer, Price, Quantity, Description
+
+
+def columns(*rows):
+    return [list(column) for column in zip(*rows)]
+
+
+def test_validate_columns_all_valid():
+    validation = validate_columns(*columns(('Smartphone', 'Pixel', 'Google', 97320, 1, ''),
+                                           ('Computer', 'Mac', 'Apple', 1, 5, 'really excellent product')))
+    assert validation.mask == [True, True]
+    assert validation.errors == []
+
+
+def test_validate_columns_reports_every_invalid_field():
+    validation = validate_columns(*columns(('Smartphone', 'Pixel', 'Google', 97320, 1, ''),
+                                           ('Tablet', '<script>', 'Apple', -1, 6, ''),
+                                           ('Computer', 'Mac', 'A', 100, 1, 'root/tree')))
+    assert validation.mask == [True, False, False]
+    assert validation.valid_rows() == [0]
+    assert [(error.row, error.field) for error in validation.errors] == [
+        (1, 'category'), (1, 'name'), (1, 'price'), (1, 'quantity'), (2, 'manufacturer'), (2, 'description')]
+    assert 'Tablet' in validation.errors[0].message
+
+
+def test_validate_columns_handles_huge_numbers():
+    validation = validate_columns(*columns(('Smartphone', 'Pixel', 'Google', 2 ** 70, 1, '')))
+    assert validation.mask == [False]
+    assert validation.errors[0].field == 'price'
+
+
+def test_validate_columns_reports_unparsed_text():
+    validation = validate_columns(*columns(('Smartphone', 'Pixel', 'Google', 'free', 'two', '')))
+    assert validation.mask == [False]
+    assert [(error.field, error.message) for error in validation.errors] == [
+        ('price', 'Invalid price: free'), ('quantity', 'Invalid quantity: two')]
+
+
+def test_validate_columns_empty():
+    assert validate_columns([], [], [], [], [], []).mask == []
+
+
+def test_validate_columns_length_mismatch():
+    with pytest.raises(ValueError):
+        validate_columns(['Smartphone'], ['Pixel'], [], [1], [1], [''])
+
+
+def test_build_items_only_builds_valid_rows():
+    items, validation = build_items(*columns(('Smartphone', 'Pixel', 'Google', 97320, 1, ''),
+                                             ('Computer', 'Mac', 'Apple', 1, 0, ''),
+                                             ('Computer', 'Mac', 'Apple', 150, 2, 'used')))
+    assert items == [
+        (0, Smartphone(Name('Pixel'), Manufacturer('Google'), Price.create(973, 20), Quantity(1), Description(''))),
+        (2, Computer(Name('Mac'), Manufacturer('Apple'), Price.create(1, 50), Quantity(2), Description('used'))),
+    ]
+    assert [error.row for error in validation.errors] == [1]
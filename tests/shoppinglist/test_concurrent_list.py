@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+
+import pytest
+from valid8 import ValidationError
+
+from shopping_list.concurrent_list import ConcurrentShoppingList
+from shopping_list.domain import Smartphone, Computer, Name, Manufacturer, Price, Quantity, Description
+
+
+def item(index: int):
+    return (Smartphone if index % 2 else Computer)(Name(f'Item {index}'), Manufacturer(f'Maker {"ABC"[index % 3]}'),
+                                                   Price.create(100 + index), Quantity(1 + index % 4),
+                                                   Description(''))
+
+
+def add(shopping_list, value):
+    if value.category == 'Smartphone':
+        return shopping_list.add_smartphone(value)
+    return shopping_list.add_computer(value)
+
+
+def test_writes_publish_new_snapshots():
+    shopping_list = ConcurrentShoppingList()
+    empty = shopping_list.snapshot()
+    snapshot = add(shopping_list, item(1))
+    assert (empty.version, empty.items()) == (0, 0)
+    assert (snapshot.version, snapshot.items()) == (1, 1)
+    assert shopping_list.snapshot() is snapshot
+    assert list(shopping_list) == [item(1)]
+    assert shopping_list.total() == Price.create(202)
+
+
+def test_snapshots_are_not_affected_by_later_writes():
+    shopping_list = ConcurrentShoppingList()
+    for index in range(3):
+        add(shopping_list, item(index))
+    before = shopping_list.snapshot()
+    shopping_list.change_quantity(0, Quantity(5))
+    shopping_list.remove_item(2)
+    shopping_list.sort_by_price()
+    assert [value.quantity for value in before] == [Quantity(1), Quantity(2), Quantity(3)]
+    assert before.total_quantity() == 6
+    assert shopping_list.snapshot().total_quantity() == 7
+    assert before.filter(category='Smartphone') == [item(1)]
+    assert shopping_list.snapshot().filter(name_prefix='item 1', price_between=(Price.create(101), None)) == [item(1)]
+
+
+def test_failed_writes_keep_the_list_consistent():
+    shopping_list = ConcurrentShoppingList()
+    add(shopping_list, item(1))
+    with pytest.raises(ValueError):
+        add(shopping_list, item(1))
+    with pytest.raises(ValidationError):
+        shopping_list.item(1)
+    assert shopping_list.items() == 1
+
+
+def test_transaction_publishes_once():
+    shopping_list = ConcurrentShoppingList()
+    with shopping_list.transaction() as inner:
+        for index in range(5):
+            add(inner, item(index))
+        assert shopping_list.items() == 0
+    assert (shopping_list.snapshot().version, shopping_list.items()) == (1, 5)
+
+
+def test_failed_transaction_does_not_publish():
+    shopping_list = ConcurrentShoppingList()
+    add(shopping_list, item(1))
+    before = shopping_list.snapshot()
+    with pytest.raises(ValueError):
+        with shopping_list.transaction() as inner:
+            add(inner, item(2))
+            add(inner, item(1))
+    assert shopping_list.snapshot() is before
+
+
+def test_stress_readers_always_see_consistent_snapshots():
+    shopping_list = ConcurrentShoppingList()
+    stop = threading.Event()
+    errors = []
+    reads = []
+
+    def writer(seed: int) -> None:
+        rng = random.Random(seed)
+        try:
+            for _ in range(100):
+                with shopping_list.transaction() as inner:
+                    if inner.items() < 10 and rng.random() < 0.6:
+                        candidate = item(rng.randrange(40))
+                        if not inner.there_are_duplicates(candidate):
+                            add(inner, candidate)
+                    elif inner.items():
+                        inner.remove_item(rng.randrange(inner.items()))
+                    if inner.items():
+                        inner.change_quantity(rng.randrange(inner.items()), Quantity(rng.randint(1, 5)))
+        except Exception as e:
+            errors.append(e)
+
+    def reader() -> None:
+        seen = 0
+        version = -1
+        try:
+            while not stop.is_set():
+                snapshot = shopping_list.snapshot()
+                assert snapshot.version >= version
+                version = snapshot.version
+                values = list(snapshot)
+                assert len(values) == snapshot.items() <= 10
+                assert len({value.key for value in values}) == len(values)
+                assert sum(value.quantity.value for value in values) == snapshot.total_quantity()
+                assert sum(value.price.value_in_cents * value.quantity.value for value in values) == \
+                       snapshot.total().value_in_cents
+                seen += 1
+                time.sleep(0.0001)
+        except Exception as e:
+            errors.append(e)
+        reads.append(seen)
+
+    writers = [threading.Thread(target=writer, args=(seed,)) for seed in range(4)]
+    readers = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join(60)
+    stop.set()
+    for thread in readers:
+        thread.join(60)
+    assert errors == []
+    assert shopping_list.snapshot().version == 4 * 100
+    assert all(seen > 0 for seen in reads)
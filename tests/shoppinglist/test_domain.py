@@ -1,8 +1,10 @@
+from dataclasses import replace
+
 import pytest
 from valid8 import ValidationError
 
 from shopping_list.domain import Name, Manufacturer, Quantity, Description, Price, Smartphone, Computer, ShoppingList, \
-    Username, Email, Password
+    Username, Email, Password, flyweight_stats
 
 
 def test_name_format():
@@ -84,6 +86,34 @@ def test_price_add():
     assert Price.create(9, 99).add(Price.create(0, 1)) == Price.create(10)
 
 
+def test_price_create_out_of_range():
+    for euro, cents in [(0, -1), (0, 100), (Price.max_value_in_cents // 100 + 1, 0)]:
+        with pytest.raises(ValidationError):
+            Price.create(euro, cents)
+
+
+def test_price_parse_cents():
+    values = ['10.20', '0', '7', '0.05', '999999999.99']
+    assert Price.parse_cents(values) == [Price.parse(value).value_in_cents for value in values]
+    assert Price.parse_cents([]) == []
+
+
+def test_price_parse_cents_wrong_values():
+    for values in [['1.2'], ['1', 'abc'], ['1\n2'], ['1', '1000000000'], ['1', '100000000000']]:
+        with pytest.raises(ValidationError):
+            Price.parse_cents(values)
+    with pytest.raises(ValueError):
+        Price.parse_cents([''])
+
+
+def test_price_sum():
+    assert Price.sum_cents([1099, 1]) == Price.create(11)
+    assert Price.sum([Price.create(1, 50), Price.create(2, 50)]) == Price.create(4)
+    assert Price.sum([]) == Price.create(0)
+    with pytest.raises(ValidationError):
+        Price.sum_cents([Price.max_value_in_cents, 1])
+
+
 def test_username_format():
     wrong_values = ['', '_ciao_', '<script>alert()</script>', 'uno spazio', 'è accentata', '%', 'A' * 26]
     for value in wrong_values:
@@ -251,3 +281,190 @@ def test_shopping_list_change_quantity(smartphones):
         shopping.change_quantity(shopping.items(), Quantity(1))
 
     assert shopping.item(0).quantity.value == 1
+
+
+def test_shopping_list_filter(smartphones, computers):
+    shopping = ShoppingList()
+    for computer in computers:
+        shopping.add_computer(computer)
+    for smartphone in smartphones:
+        shopping.add_smartphone(smartphone)
+
+    assert shopping.filter() == computers + smartphones
+    assert shopping.filter(category='Smartphone') == smartphones
+    assert shopping.filter(manufacturer=Manufacturer('HP')) == [computers[4]]
+    assert shopping.filter(price_between=(Price.create(100), Price.create(101))) == \
+           [computers[0], computers[3], smartphones[0], smartphones[4]]
+    assert shopping.filter(price_between=(Price.create(10000), None)) == [computers[2], smartphones[3]]
+    assert shopping.filter(name_prefix='ma') == [computers[1]]
+    assert shopping.filter(category='Computer', price_between=(None, Price.create(100))) == [computers[3]]
+    assert shopping.filter(category='Computer', manufacturer=Manufacturer('Apple')) == []
+
+
+def test_shopping_list_filter_follows_mutations(smartphones):
+    shopping = ShoppingList()
+    for smartphone in smartphones:
+        shopping.add_smartphone(smartphone)
+    shopping.remove_item(0)
+    assert shopping.filter(manufacturer=Manufacturer('Samsung')) == []
+    shopping.change_quantity(0, Quantity(5))
+    assert shopping.filter(manufacturer=Manufacturer('Apple'))[0].quantity == Quantity(5)
+    shopping.clear()
+    assert shopping.filter(category='Smartphone') == []
+
+
+def test_price_from_cents():
+    assert Price.from_cents(1099) == Price.create(10, 99)
+    with pytest.raises(ValidationError):
+        Price.from_cents(-1)
+
+
+def test_shopping_list_totals(smartphones, computers):
+    shopping = ShoppingList()
+    assert shopping.total() == Price.create(0)
+    assert shopping.subtotals_by_category() == {}
+
+    shopping.add_smartphone(smartphones[0])
+    shopping.add_smartphone(smartphones[1])
+    shopping.add_computer(computers[0])
+    assert shopping.total() == Price.create(100 * 3 + 1007 * 2 + 101)
+    assert shopping.total_quantity() == 6
+    assert shopping.subtotals_by_category() == {'Computer': Price.create(101), 'Smartphone': Price.create(2314)}
+    assert shopping.subtotals_by_manufacturer() == {'Apple': Price.create(2014), 'Samsung': Price.create(300),
+                                                    'Xiaomi': Price.create(101)}
+
+    shopping.change_quantity(1, Quantity(1))
+    assert shopping.total() == Price.create(300 + 1007 + 101)
+    assert shopping.total_quantity() == 5
+
+    shopping.remove_item(2)
+    assert shopping.subtotals_by_category() == {'Smartphone': Price.create(1307)}
+    assert 'Xiaomi' not in shopping.subtotals_by_manufacturer()
+
+    shopping.clear()
+    assert shopping.total() == Price.create(0)
+    assert shopping.total_quantity() == 0
+
+
+def test_shopping_list_iteration(smartphones):
+    shopping = ShoppingList()
+    assert len(shopping) == 0
+    assert list(shopping) == []
+    for smartphone in smartphones:
+        shopping.add_smartphone(smartphone)
+    assert len(shopping) == len(smartphones)
+    assert list(shopping) == smartphones
+    assert shopping[1] == smartphones[1]
+    with pytest.raises(ValidationError):
+        shopping[-1]
+
+
+def test_shopping_list_slice_is_a_view(smartphones):
+    shopping = ShoppingList()
+    for smartphone in smartphones:
+        shopping.add_smartphone(smartphone)
+    view = shopping[1:4]
+    assert len(view) == 3
+    assert list(view) == smartphones[1:4]
+    assert view[0] == smartphones[1]
+    assert view[-1] == smartphones[3]
+    assert list(view[::2]) == [smartphones[1], smartphones[3]]
+    shopping.change_quantity(1, Quantity(5))
+    assert view[0].quantity == Quantity(5)
+
+
+def test_shopping_list_iter_page(smartphones):
+    shopping = ShoppingList()
+    for smartphone in smartphones:
+        shopping.add_smartphone(smartphone)
+    assert list(shopping.iter_page(0, 2)) == smartphones[0:2]
+    assert list(shopping.iter_page(4, 2)) == smartphones[4:]
+    assert list(shopping.iter_page(10, 2)) == []
+    with pytest.raises(ValidationError):
+        shopping.iter_page(-1, 2)
+
+
+def test_flyweights_return_the_same_instance():
+    assert Manufacturer.of('Apple') is Manufacturer.of('Apple')
+    assert Name.of('Iphone 12') is Name.of('Iphone 12')
+    assert Description.of('used') is Description.of('used')
+    assert Quantity.of(3) is Quantity.of(3)
+    assert Quantity.cast('3') is Quantity.of(3)
+    assert Manufacturer.of('Apple') == Manufacturer('Apple')
+
+
+def test_flyweights_still_validate():
+    with pytest.raises(ValidationError):
+        Manufacturer.of('A')
+    with pytest.raises(ValidationError):
+        Quantity.of(6)
+
+
+def test_flyweight_stats():
+    before = flyweight_stats()['Manufacturer']
+    Manufacturer.of('Flyweight')
+    Manufacturer.of('Flyweight')
+    after = flyweight_stats()['Manufacturer']
+    assert after.hits == before.hits + 1
+    assert after.maxsize == 256
+    assert flyweight_stats()['Quantity'].maxsize == 8
+
+
+def test_shopping_list_undo_redo(smartphones, computers):
+    shopping = ShoppingList()
+    assert not shopping.undo()
+    shopping.add_smartphone(smartphones[0])
+    shopping.add_computer(computers[0])
+    shopping.change_quantity(0, Quantity(5))
+    shopping.remove_item(1)
+    shopping.sort_by_price()
+
+    assert shopping.undo() and shopping.undo()
+    assert list(shopping) == [replace(smartphones[0], quantity=Quantity(5)), computers[0]]
+    assert shopping.total_quantity() == 5 + computers[0].quantity.value
+    assert shopping.filter(category='Computer') == [computers[0]]
+    assert shopping.undo()
+    assert list(shopping) == [smartphones[0], computers[0]]
+
+    assert shopping.redo()
+    assert shopping.item(0).quantity == Quantity(5)
+    shopping.remove_item(0)
+    assert not shopping.can_redo()
+    assert not shopping.redo()
+    assert list(shopping) == [computers[0]]
+
+
+def test_shopping_list_forget_history(smartphones):
+    shopping = ShoppingList()
+    shopping.add_smartphone(smartphones[0])
+    shopping.forget_history()
+    assert not shopping.can_undo()
+    assert not shopping.undo()
+    assert list(shopping) == [smartphones[0]]
+
+
+def test_shopping_list_replace_all_is_one_undo_step(smartphones, computers):
+    shopping = ShoppingList()
+    shopping.add_smartphone(smartphones[0])
+    shopping.replace_all([computers[0], smartphones[1]])
+    assert list(shopping) == [computers[0], smartphones[1]]
+    assert shopping.total_quantity() == computers[0].quantity.value + smartphones[1].quantity.value
+    assert shopping.filter(category='Smartphone') == [smartphones[1]]
+    assert shopping.undo()
+    assert list(shopping) == [smartphones[0]]
+
+
+def test_shopping_list_search_follows_mutations(smartphones, computers):
+    shopping = ShoppingList()
+    shopping.add_smartphone(smartphones[0])
+    shopping.add_computer(computers[0])
+    name = computers[0].name.value
+    assert shopping.search(name[:-1]) == [computers[0]]
+    shopping.remove_item(1)
+    assert shopping.search(name) == []
+    shopping.undo()
+    assert shopping.search(name) == [computers[0]]
+    shopping.change_quantity(1, Quantity(4))
+    assert shopping.search(name) == [replace(computers[0], quantity=Quantity(4))]
+    shopping.clear()
+    assert shopping.search(name) == []
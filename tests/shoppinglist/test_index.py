@@ -0,0 +1,114 @@
+from shopping_list.index import HashIndex, SortedIndex, PrefixTrie, TextIndex, tokenize, trigrams
+
+apple = ('Smartphone', 'Iphone', 'Apple')
+pixel = ('Smartphone', 'Pixel', 'Google')
+macbook = ('Computer', 'Macbook', 'Apple')
+
+
+def test_hash_index_find():
+    index = HashIndex()
+    index.add('Apple', apple)
+    index.add('Apple', macbook)
+    index.add('Google', pixel)
+    assert index.find('Apple') == {apple, macbook}
+    assert index.find('Samsung') == set()
+
+
+def test_hash_index_remove():
+    index = HashIndex()
+    index.add('Apple', apple)
+    index.remove('Apple', apple)
+    assert index.find('Apple') == set()
+
+
+def test_sorted_index_find_range():
+    index = SortedIndex()
+    index.add(100, apple)
+    index.add(200, pixel)
+    index.add(300, macbook)
+    assert index.find(100, 200) == {apple, pixel}
+    assert index.find(150) == {pixel, macbook}
+    assert index.find(high=100) == {apple}
+    assert index.find(301) == set()
+
+
+def test_sorted_index_remove_with_equal_values():
+    index = SortedIndex()
+    index.add(100, apple)
+    index.add(100, pixel)
+    index.remove(100, pixel)
+    assert index.find(100, 100) == {apple}
+
+
+def test_prefix_trie_find():
+    trie = PrefixTrie()
+    trie.add('Iphone', apple)
+    trie.add('Macbook', macbook)
+    trie.add('Magicbook', pixel)
+    assert trie.find('ma') == {macbook, pixel}
+    assert trie.find('MAC') == {macbook}
+    assert trie.find('') == {apple, macbook, pixel}
+    assert trie.find('x') == set()
+
+
+def test_prefix_trie_remove():
+    trie = PrefixTrie()
+    trie.add('Macbook', macbook)
+    trie.add('Magicbook', pixel)
+    trie.remove('Macbook', macbook)
+    assert trie.find('ma') == {pixel}
+    assert trie.find('mac') == set()
+
+
+def test_tokenize_and_trigrams():
+    assert tokenize('Galaxy S21, 128GB!') == ['galaxy', 's21', '128gb']
+    assert trigrams('pix') == {'  p', ' pi', 'pix', 'ix '}
+
+
+def text_index():
+    index = TextIndex()
+    index.add(apple, 'Iphone', 'Waterproof camera phone')
+    index.add(pixel, 'Pixel', 'Camera phone with stock Android')
+    index.add(macbook, 'Macbook', 'Laptop for the office')
+    return index
+
+
+def test_text_index_ranks_name_matches_first():
+    assert [key for key, _ in text_index().search('phone camera')] == [apple, pixel]
+    assert text_index().search('iphone')[0] == (apple, 2.0)
+
+
+def test_text_index_fuzzy_and_partial_words():
+    index = text_index()
+    assert index.search('pixle')[0][0] == pixel
+    assert index.search('macbok')[0][0] == macbook
+    assert index.search('waterprof')[0][0] == apple
+    assert index.search('pix')[0][0] == pixel
+    assert index.search('zzz') == []
+    assert index.search('') == []
+
+
+def test_text_index_limit():
+    assert len(text_index().search('phone', limit=1)) == 1
+    assert text_index().search('phone', limit=0) == []
+
+
+def test_text_index_remove():
+    index = text_index()
+    index.remove(pixel)
+    assert [key for key, _ in index.search('camera')] == [apple]
+    assert index.search('android') == []
+    index.add(pixel, 'Pixel', 'Camera phone with stock Android')
+    assert index.search('android')[0][0] == pixel
+
+
+def test_text_index_matches_exhaustive_scoring():
+    index = TextIndex()
+    words = ['black', 'white', 'gaming', 'office', 'camera', 'battery', 'silver', 'travel']
+    for number in range(300):
+        key = ('Smartphone', f'Phone {number}', 'Maker')
+        index.add(key, f'{words[number % 8]} {number % 7}', f'{words[number % 5]} {words[number % 3]}')
+    for query in ('gaming 3', 'camra silver', 'white black 5', 'travel'):
+        everything = index.search(query, limit=300)
+        top = index.search(query, limit=5)
+        assert [score for _, score in top] == [score for _, score in everything[:5]]
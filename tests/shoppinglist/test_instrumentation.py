@@ -0,0 +1,86 @@
+import io
+
+import pytest
+
+from shopping_list import instrumentation
+from shopping_list.instrumentation import Stats
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, '_enabled', True)
+    instrumentation.stats.reset()
+    yield instrumentation.stats
+    instrumentation.stats.reset()
+
+
+def test_stats_record():
+    stats = Stats()
+    stats.record('a', 0.5)
+    stats.record('a', 1.5)
+    assert stats.timings['a'].count == 2
+    assert stats.timings['a'].total == 2.0
+    assert stats.timings['a'].max == 1.5
+
+
+def test_stats_dump():
+    stats = Stats()
+    stats.record('http.fetch', 0.25)
+    stats.increment('http.bytes', 100)
+    out = io.StringIO()
+    stats.dump(out)
+    assert 'http.fetch' in out.getvalue()
+    assert 'http.bytes' in out.getvalue()
+
+
+def test_timed_is_a_no_op_when_disabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, '_enabled', False)
+
+    def function():
+        pass
+
+    assert instrumentation.timed('noop')(function) is function
+
+
+def test_timed_records_when_enabled(enabled):
+    @instrumentation.timed('work')
+    def work(value):
+        return value * 2
+
+    assert work(2) == 4
+    assert enabled.timings['work'].count == 1
+
+
+def test_timed_records_on_exception(enabled):
+    @instrumentation.timed('fail')
+    def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        fail()
+    assert enabled.timings['fail'].count == 1
+
+
+def test_timer_and_count_when_enabled(enabled):
+    with instrumentation.timer('block'):
+        pass
+    instrumentation.count('things', 3)
+    assert enabled.timings['block'].count == 1
+    assert enabled.counters['things'] == 3
+
+
+def test_timer_and_count_when_disabled(monkeypatch):
+    monkeypatch.setattr(instrumentation, '_enabled', False)
+    stats = instrumentation.stats
+    before = dict(stats.timings), dict(stats.counters)
+    with instrumentation.timer('block'):
+        pass
+    instrumentation.count('things')
+    assert (stats.timings, stats.counters) == before
+
+
+def test_is_enabled(monkeypatch):
+    monkeypatch.setenv(instrumentation.ENV_VARIABLE, '1')
+    assert instrumentation.is_enabled()
+    monkeypatch.setenv(instrumentation.ENV_VARIABLE, '0')
+    assert not instrumentation.is_enabled()
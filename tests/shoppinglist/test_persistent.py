@@ -0,0 +1,71 @@
+import random
+import sys
+
+import pytest
+from valid8 import ValidationError
+
+from shopping_list.persistent import PersistentVector, History
+
+
+def test_vector_matches_a_list_under_random_changes():
+    rng = random.Random(7)
+    vector, model, versions = PersistentVector(), [], []
+    for step in range(2000):
+        choice = rng.random()
+        if not model or choice < 0.4:
+            index = rng.randint(0, len(model))
+            vector, model = vector.insert(index, step), model[:index] + [step] + model[index:]
+        elif choice < 0.7:
+            index = rng.randrange(len(model))
+            vector, model = vector.delete(index), model[:index] + model[index + 1:]
+        else:
+            index = rng.randrange(len(model))
+            vector, model = vector.set(index, -step), model[:index] + [-step] + model[index + 1:]
+        versions.append((vector, model))
+    for version, expected in versions[::50]:
+        assert list(version) == expected
+        assert len(version) == len(expected)
+        assert [version[index] for index in range(len(version))] == expected
+
+
+def test_vector_stays_balanced_beyond_the_recursion_limit():
+    size = sys.getrecursionlimit() * 3
+    vector = PersistentVector()
+    for index in range(size):
+        vector = vector.append(index)
+    for _ in range(size // 2):
+        vector = vector.delete(0)
+    assert list(vector) == list(range(size // 2, size))
+    assert list(PersistentVector.of(range(size))) == list(range(size))
+
+
+def test_vector_versions_are_unchanged():
+    first = PersistentVector.of('abc')
+    second = first.set(1, 'x').append('d').delete(0)
+    assert list(first) == ['a', 'b', 'c']
+    assert list(second) == ['x', 'c', 'd']
+
+
+def test_vector_index_out_of_range():
+    vector = PersistentVector.of([1, 2])
+    for change in (lambda: vector[2], lambda: vector.set(-1, 0), lambda: vector.delete(2),
+                   lambda: vector.insert(3, 0)):
+        with pytest.raises(ValidationError):
+            change()
+    assert list(vector.insert(2, 3)) == [1, 2, 3]
+
+
+def test_history_undo_redo():
+    history = History()
+    history.record(PersistentVector.of([1]))
+    history.record(PersistentVector.of([1, 2]))
+    assert list(history.undo()) == [1]
+    assert list(history.undo()) == []
+    assert history.undo() is None
+    assert list(history.redo()) == [1]
+    history.record(PersistentVector.of([3]))
+    assert not history.can_redo
+    assert history.redo() is None
+    history.reset()
+    assert not history.can_undo
+    assert list(history.current) == [3]
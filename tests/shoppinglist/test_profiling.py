@@ -0,0 +1,60 @@
+import io
+import pstats
+import tracemalloc
+from unittest.mock import patch
+
+import pytest
+
+from shopping_list.app import main, parse_args
+from shopping_list.domain import Name
+from shopping_list.profiling import subsystem, profile, trace_memory
+
+
+def test_subsystem():
+    assert subsystem('/site-packages/valid8/entry_points.py') == 'validation'
+    assert subsystem('/root/package/validation/regex.py') == 'validation'
+    assert subsystem('/site-packages/requests/api.py') == 'network'
+    assert subsystem('/root/package/shopping_list/menu.py') == 'menu'
+    assert subsystem('/root/package/shopping_list/domain.py') == 'domain'
+    assert subsystem('/root/package/shopping_list/app.py') == 'app'
+    assert subsystem('/usr/lib/python3.9/inspect.py') == 'other'
+
+
+def test_profile(tmp_path):
+    output = tmp_path / 'session.prof'
+    report = io.StringIO()
+    profile(lambda: Name('Galaxy S20'), output, report)
+    assert pstats.Stats(str(output)).total_calls > 0
+    assert 'validation' in report.getvalue()
+    assert 'domain' in report.getvalue()
+
+
+def test_trace_memory(tmp_path):
+    output = tmp_path / 'session.snapshot'
+    report = io.StringIO()
+    trace_memory(lambda: [Name('Galaxy S20') for _ in range(10)], output, report)
+    assert tracemalloc.Snapshot.load(str(output)).traces
+    assert 'SUBSYSTEM' in report.getvalue()
+    assert not tracemalloc.is_tracing()
+
+
+def test_parse_args(tmp_path):
+    args = parse_args(['--profile', str(tmp_path / 'out.prof')])
+    assert args.profile == tmp_path / 'out.prof'
+    assert args.memory is None
+
+
+def test_parse_args_rejects_unknown_arguments(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(['--profle', str(tmp_path / 'out.prof')])
+    assert 'unrecognized arguments: --profle' in capsys.readouterr().err
+
+
+@patch('builtins.input', side_effect=['0'])
+@patch('builtins.print')
+def test_main_with_profile(mocked_print, mocked_input, tmp_path):
+    output = tmp_path / 'out.prof'
+    with patch('sys.stderr', io.StringIO()):
+        main('__main__', ['--profile', str(output)])
+    mocked_print.assert_any_call('Bye!')
+    assert output.exists()
@@ -0,0 +1,83 @@
+from dataclasses import replace
+
+import pytest
+from valid8 import ValidationError
+
+from shopping_list.domain import Smartphone, Computer, Name, Manufacturer, Price, Quantity, Description
+from shopping_list.reconcile import diff, merge, Conflict
+
+PIXEL = Smartphone(Name('Pixel'), Manufacturer('Google'), Price.create(900), Quantity(1), Description(''))
+MAC = Computer(Name('Macbook'), Manufacturer('Apple'), Price.create(2000), Quantity(1), Description(''))
+REDMI = Smartphone(Name('Redmi Note'), Manufacturer('Xiaomi'), Price.create(200), Quantity(2), Description(''))
+
+
+def test_diff_finds_minimal_operations():
+    changes = diff([PIXEL, MAC], [replace(MAC, quantity=Quantity(3)), REDMI])
+    assert changes.added == [REDMI]
+    assert changes.edited == [replace(MAC, quantity=Quantity(3))]
+    assert changes.deleted == [PIXEL.key]
+    assert len(changes) == 3
+
+
+def test_diff_ignores_order_and_equal_copies():
+    copy = Smartphone(Name('Pixel'), Manufacturer('Google'), Price.create(900), Quantity(1), Description(''))
+    assert len(diff([PIXEL, MAC], [MAC, copy])) == 0
+
+
+def test_diff_keys_include_the_category():
+    computer = Computer(PIXEL.name, PIXEL.manufacturer, PIXEL.price, PIXEL.quantity, PIXEL.description)
+    changes = diff([PIXEL], [computer])
+    assert (changes.added, changes.deleted) == ([computer], [PIXEL.key])
+
+
+def test_merge_takes_changes_from_both_sides():
+    local = [replace(PIXEL, quantity=Quantity(2)), REDMI]
+    remote = [PIXEL]
+    merged = merge([PIXEL, MAC], local, remote)
+    assert merged.items == [replace(PIXEL, quantity=Quantity(2)), REDMI]
+    assert merged.conflicts == []
+
+
+def test_merge_combines_edits_of_different_fields():
+    local = [replace(PIXEL, quantity=Quantity(3))]
+    remote = [replace(PIXEL, price=Price.create(850))]
+    merged = merge([PIXEL], local, remote)
+    assert merged.items == [replace(PIXEL, quantity=Quantity(3), price=Price.create(850))]
+    assert merged.conflicts == []
+
+
+def test_merge_reports_conflicts_and_applies_preference():
+    local = [replace(PIXEL, quantity=Quantity(3))]
+    remote = [replace(PIXEL, quantity=Quantity(4))]
+    merged = merge([PIXEL], local, remote)
+    assert merged.items == local
+    assert merged.conflicts == [Conflict(PIXEL.key, local[0], remote[0], local[0])]
+    assert merge([PIXEL], local, remote, prefer='remote').items == remote
+
+
+def test_merge_edit_against_delete_is_a_conflict():
+    local = [replace(PIXEL, quantity=Quantity(3))]
+    merged = merge([PIXEL], local, [])
+    assert merged.items == local
+    assert merged.conflicts == [Conflict(PIXEL.key, local[0], None, local[0])]
+    assert merge([PIXEL], local, [], prefer='remote').items == []
+
+
+def test_merge_same_item_added_on_both_sides():
+    merged = merge([], [REDMI], [replace(REDMI, quantity=Quantity(1))])
+    assert len(merged.conflicts) == 1
+    assert merge([], [REDMI], [REDMI]).items == [REDMI]
+
+
+def test_merge_rejects_unknown_preference():
+    with pytest.raises(ValidationError):
+        merge([], [], [], prefer='newest')
+
+
+def test_merge_result_gives_server_operations():
+    base = [PIXEL, MAC]
+    local = [PIXEL, MAC, REDMI]
+    remote = [replace(MAC, quantity=Quantity(2))]
+    merged = merge(base, local, remote)
+    to_server = diff(remote, merged.items)
+    assert (to_server.added, to_server.edited, to_server.deleted) == ([REDMI], [], [])
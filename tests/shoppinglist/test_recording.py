@@ -0,0 +1,114 @@
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+import requests.api
+
+from shopping_list import recording, token_cache
+from shopping_list.app import main
+from shopping_list.recording import Exchange, ReplayError, record, replay, load, REDACTED
+
+KEY = '3be7163c1baea2a220777a82ec7e59a4ef545f26'
+LOGIN = 'http://localhost:8000/api/v1/auth/login/'
+ITEMS = 'http://localhost:8000/api/v1/shopping-list/'
+ITEM = {'id': 1, 'name': 'Mac', 'category': 'Computer', 'manufacturer': 'Apple', 'price': 10000, 'quantity': 1,
+        'description': ''}
+
+
+def server_request(method, url, **kwargs):
+    res = requests.Response()
+    res.status_code = 200
+    res.headers['Content-Type'] = 'application/json'
+    res._content = json.dumps({'key': KEY} if url == LOGIN else [ITEM]).encode()
+    return res
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.setattr(requests.api, 'request', server_request)
+    path = tmp_path / 'session.jsonl'
+    with record(path):
+        requests.post(url=LOGIN, data={'username': 'ciccioRiccio99', 'password': 'ciccioRiccio9!'})
+        requests.get(url=ITEMS, headers={'Authorization': f'Token {KEY}'})
+    return path
+
+
+def test_record_writes_json_lines(session):
+    exchanges = load(session)
+    assert [(exchange.method, exchange.url, exchange.status) for exchange in exchanges] == \
+           [('POST', LOGIN, 200), ('GET', ITEMS, 200)]
+    assert exchanges[0].payload == {'username': 'ciccioRiccio99', 'password': REDACTED}
+    assert json.loads(exchanges[0].body) == {'key': REDACTED}
+    assert exchanges[1].payload is None
+    assert json.loads(exchanges[1].body) == [ITEM]
+    assert exchanges[1].headers['Content-Type'] == 'application/json'
+    assert all(exchange.latency >= 0 for exchange in exchanges)
+    assert requests.api.request is server_request
+
+
+def test_exchange_json_round_trip():
+    exchange = Exchange('PATCH', ITEMS, {'quantity': 2}, 200, '{}', 0.5)
+    assert Exchange.from_json(exchange.to_json()) == exchange
+    assert exchange.response().json() == {}
+
+
+def test_replay_serves_recorded_responses(session, monkeypatch):
+    monkeypatch.setattr(requests.api, 'request', None)
+    with replay(session):
+        res = requests.post(url=LOGIN, data={'username': 'ciccioRiccio99', 'password': 'anotherPassword1!'})
+        assert res.status_code == 200 and res.json() == {'key': REDACTED}
+        assert requests.get(url=ITEMS, headers={'Authorization': 'Token other'}).json() == [ITEM]
+        with pytest.raises(ReplayError):
+            requests.get(url=ITEMS)
+    assert requests.api.request is None
+
+
+def test_replay_rejects_unexpected_calls(session):
+    with replay(session):
+        with pytest.raises(ReplayError):
+            requests.get(url=ITEMS)
+
+
+def test_replay_realtime_waits_recorded_latency(session):
+    latencies = [exchange.latency for exchange in load(session)]
+    with patch.object(recording.time, 'sleep') as mocked_sleep, replay(session, realtime=True):
+        requests.post(url=LOGIN, data={'username': 'ciccioRiccio99', 'password': 'ciccioRiccio9!'})
+        requests.get(url=ITEMS)
+    assert [args[0] for args, _ in mocked_sleep.call_args_list] == latencies
+
+
+def test_replay_full_speed_does_not_wait(session):
+    with patch.object(recording.time, 'sleep') as mocked_sleep, replay(session):
+        requests.post(url=LOGIN, data={'username': 'ciccioRiccio99', 'password': 'ciccioRiccio9!'})
+    mocked_sleep.assert_not_called()
+
+
+@patch('builtins.input', side_effect=['1', 'ciccioRiccio99', 'ciccioRiccio9!', '0', '0'])
+@patch('builtins.print')
+def test_app_replays_session(mocked_print, mocked_input, session):
+    main('__main__', ['--replay', str(session)])
+    mocked_print.assert_any_call('*** SHOPPING LIST ***')
+    assert any('Mac' in str(args) for args, _ in mocked_print.call_args_list)
+
+
+@patch('builtins.input', side_effect=['1', 'ciccioRiccio99', 'ciccioRiccio9!', '0', '0'])
+@patch('builtins.print')
+def test_app_replay_bypasses_the_token_cache(mocked_print, mocked_input, session):
+    token_cache.save('cached')
+    main('__main__', ['--replay', str(session)])
+    assert any('Mac' in str(args) for args, _ in mocked_print.call_args_list)
+    assert token_cache.load() == 'cached'
+
+
+def test_record_and_replay_json_list_payloads(tmp_path, monkeypatch):
+    monkeypatch.setattr(requests.api, 'request', server_request)
+    path = tmp_path / 'batch.jsonl'
+    operations = [{'op': 'edit', 'id': 3, 'item': {'quantity': 2}}, {'op': 'delete', 'id': 4}]
+    with record(path):
+        requests.post(url=ITEMS, json=operations)
+    assert load(path)[0].payload == operations
+    with replay(path):
+        requests.post(url=ITEMS, json=operations)
+        with pytest.raises(ReplayError):
+            requests.post(url=ITEMS, json=operations[:1])
@@ -0,0 +1,66 @@
+import random
+import threading
+
+import pytest
+
+from shopping_list import instrumentation
+from shopping_list.refresh import Refresher
+
+
+def test_delay_stays_within_jitter():
+    refresher = Refresher(lambda: None, 10.0, 2.0, random.Random(42))
+    delays = [refresher.delay() for _ in range(1000)]
+    assert all(8.0 <= delay <= 12.0 for delay in delays)
+    assert len(set(delays)) > 1
+    assert Refresher(lambda: None, 1.0, 5.0).delay() >= 0.0
+
+
+def test_invalid_interval_or_jitter():
+    with pytest.raises(ValueError):
+        Refresher(lambda: None, 0.0)
+    with pytest.raises(ValueError):
+        Refresher(lambda: None, 1.0, -1.0)
+
+
+def test_runs_job_periodically_and_keeps_the_latest_result():
+    runs = []
+    done = threading.Event()
+
+    def job():
+        runs.append(threading.current_thread())
+        if len(runs) == 3:
+            done.set()
+        return len(runs)
+
+    with Refresher(job, 0.001) as refresher:
+        assert done.wait(5)
+    assert refresher.take() >= 3
+    assert refresher.take() is None
+    assert all(thread is not threading.current_thread() for thread in runs)
+
+
+def test_failures_are_counted_and_skipped(monkeypatch):
+    calls = []
+    done = threading.Event()
+
+    def job():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError('offline')
+        done.set()
+        return 'fresh'
+
+    monkeypatch.setattr(instrumentation, '_enabled', True)
+    instrumentation.stats.reset()
+    with Refresher(job, 0.001) as refresher:
+        assert done.wait(5)
+        assert refresher.stop(5)
+    assert refresher.take() == 'fresh'
+    assert instrumentation.stats.counters['refresh.failures'] == 1
+    instrumentation.stats.reset()
+
+
+def test_stop_before_the_first_run():
+    refresher = Refresher(lambda: pytest.fail('should not run'), 60.0).start()
+    assert refresher.stop(5)
+    assert refresher.take() is None
@@ -0,0 +1,162 @@
+import random
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from shopping_list.resilience import CircuitBreaker, Backoff, Resilience, CircuitOpenError, TIMEOUTS
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def response(status_code, headers=None):
+    res = Mock()
+    res.status_code = status_code
+    res.headers = headers or {}
+    return res
+
+
+@pytest.fixture(autouse=True)
+def mocked_sleep():
+    with patch('shopping_list.resilience.time.sleep') as mocked:
+        yield mocked
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0, clock=Clock())
+    breaker.record_failure()
+    assert breaker.state == 'closed' and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_probe():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.state == 'half-open'
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    clock.now = 20.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed' and breaker.failures == 0
+
+
+def test_breaker_is_thread_safe():
+    clock = Clock()
+    breaker = CircuitBreaker(failure_threshold=800, reset_timeout=10.0, clock=clock)
+    barrier = threading.Barrier(8)
+
+    def fail():
+        barrier.wait()
+        for _ in range(100):
+            breaker.record_failure()
+
+    threads = [threading.Thread(target=fail) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert breaker.failures == 800 and breaker.state == 'open'
+
+    clock.now = 10.0
+    allowed = []
+    barrier.reset()
+
+    def probe():
+        barrier.wait()
+        allowed.append(breaker.allow())
+
+    threads = [threading.Thread(target=probe) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert allowed.count(True) == 1
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    backoff = Backoff(base=0.1, cap=1.0, rng=random.Random(0))
+    delays = [backoff.delay(previous) for previous in (0.1, 0.3, 0.9, 10.0)]
+    assert all(0.1 <= delay <= 1.0 for delay in delays)
+    assert backoff.delay(0.1, retry_after=0.5) == 0.5
+    assert backoff.delay(0.1, retry_after=60.0) == 60.0
+
+
+def test_call_does_not_retry_sooner_than_retry_after(mocked_sleep):
+    send = Mock(side_effect=[response(503, {'Retry-After': '60'}), response(200)])
+    assert Resilience().call('http.fetch', send, idempotent=True).status_code == 503
+    send.assert_called_once()
+    mocked_sleep.assert_not_called()
+
+
+def test_probe_is_released_on_unexpected_errors():
+    clock = Clock()
+    resilience = Resilience(breaker=CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock))
+    resilience.call('http.save', Mock(return_value=response(500)))
+    clock.now = 10.0
+    with pytest.raises(requests.exceptions.InvalidURL):
+        resilience.call('http.save', Mock(side_effect=requests.exceptions.InvalidURL()))
+    assert resilience.call('http.save', Mock(return_value=response(200))).status_code == 200
+    assert resilience.breaker.state == 'closed'
+
+
+def test_call_passes_endpoint_timeout():
+    send = Mock(return_value=response(200))
+    assert Resilience().call('http.fetch', send).status_code == 200
+    send.assert_called_once_with(TIMEOUTS['http.fetch'])
+
+
+def test_call_retries_idempotent(mocked_sleep):
+    send = Mock(side_effect=[response(503, {'Retry-After': '2'}), requests.Timeout(), response(200)])
+    assert Resilience().call('http.fetch', send, idempotent=True).status_code == 200
+    assert send.call_count == 3
+    assert mocked_sleep.call_count == 2
+    assert mocked_sleep.call_args_list[0][0][0] == 2.0
+
+
+def test_call_does_not_retry_non_idempotent(mocked_sleep):
+    send = Mock(side_effect=[response(503), response(200)])
+    assert Resilience().call('http.save', send).status_code == 503
+    send.assert_called_once()
+    mocked_sleep.assert_not_called()
+
+
+def test_call_gives_up_after_attempts():
+    send = Mock(side_effect=requests.ConnectionError())
+    with pytest.raises(requests.ConnectionError):
+        Resilience(backoff=Backoff(attempts=2)).call('http.fetch', send, idempotent=True)
+    assert send.call_count == 2
+
+
+def test_call_fails_fast_when_open():
+    resilience = Resilience(breaker=CircuitBreaker(failure_threshold=2, clock=Clock()))
+    send = Mock(return_value=response(500))
+    with pytest.raises(CircuitOpenError):
+        resilience.call('http.fetch', send, idempotent=True)
+    assert send.call_count == 2
+    with pytest.raises(CircuitOpenError):
+        resilience.call('http.delete', send, idempotent=True)
+    assert send.call_count == 2
+
+
+def test_call_counts_retries_and_trips():
+    resilience = Resilience(breaker=CircuitBreaker(failure_threshold=3, clock=Clock()))
+    with patch('shopping_list.resilience.count') as mocked_count:
+        resilience.call('http.fetch', Mock(return_value=response(500)), idempotent=True)
+        with pytest.raises(CircuitOpenError):
+            resilience.call('http.fetch', Mock(), idempotent=True)
+    assert [args[0] for args, _ in mocked_count.call_args_list] == \
+           ['http.retries', 'http.retries', 'http.breaker.trips', 'http.breaker.rejected']
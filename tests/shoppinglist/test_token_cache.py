@@ -0,0 +1,56 @@
+import json
+import os
+import stat
+
+import pytest
+
+from shopping_list import token_cache
+
+KEY = '3be7163c1baea2a220777a82ec7e59a4ef545f26'
+
+
+def test_load_without_file(token_file):
+    assert not token_file.exists()
+    assert token_cache.load() is None
+
+
+def test_save_and_load(token_file):
+    token_cache.save(KEY)
+    assert token_cache.load() == KEY
+    assert token_cache.path() == token_file
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX permissions')
+def test_save_is_owner_only(token_file):
+    token_file.write_text('{}')
+    token_file.chmod(0o644)
+    token_cache.save(KEY)
+    assert stat.S_IMODE(token_file.stat().st_mode) == 0o600
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='POSIX permissions')
+def test_load_ignores_readable_by_others(token_file):
+    token_cache.save(KEY)
+    token_file.chmod(0o644)
+    assert token_cache.load() is None
+
+
+def test_load_expired(token_file, monkeypatch):
+    token_cache.save(KEY)
+    monkeypatch.setenv(token_cache.MAX_AGE_VARIABLE, '0.5')
+    monkeypatch.setattr(token_cache.time, 'time', lambda: json.loads(token_file.read_text())['created'] + 1)
+    assert token_cache.load() is None
+    assert not token_file.exists()
+
+
+def test_load_corrupted(token_file):
+    token_cache.save(KEY)
+    token_file.write_text('not json')
+    assert token_cache.load() is None
+
+
+def test_clear(token_file):
+    token_cache.save(KEY)
+    token_cache.clear()
+    token_cache.clear()
+    assert token_cache.load() is None
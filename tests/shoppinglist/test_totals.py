@@ -0,0 +1,27 @@
+from shopping_list.totals import Totals
+
+
+def test_totals_add():
+    totals = Totals()
+    totals.add('Smartphone', 'Apple', 1000, 2)
+    totals.add('Computer', 'Apple', 500, 1)
+    assert (totals.items, totals.quantity, totals.cents) == (2, 3, 2500)
+    assert totals.by_category() == {'Computer': 500, 'Smartphone': 2000}
+    assert totals.by_manufacturer() == {'Apple': 2500}
+
+
+def test_totals_remove_drops_empty_buckets():
+    totals = Totals()
+    totals.add('Smartphone', 'Apple', 0, 1)
+    totals.add('Smartphone', 'LG', 100, 1)
+    totals.remove('Smartphone', 'Apple', 0, 1)
+    assert totals.by_manufacturer() == {'LG': 100}
+    assert totals.by_category() == {'Smartphone': 100}
+
+
+def test_totals_clear():
+    totals = Totals()
+    totals.add('Smartphone', 'Apple', 1000, 2)
+    totals.clear()
+    assert (totals.items, totals.quantity, totals.cents) == (0, 0, 0)
+    assert totals.by_category() == {}
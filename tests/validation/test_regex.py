@@ -1,4 +1,7 @@
-from validation.regex import pattern
+import pytest
+from valid8 import validate, ValidationError
+
+from validation.regex import pattern, string_validator
 
 
 def test_regex_for_int():
@@ -9,3 +12,40 @@ def test_regex_for_int():
 def test_regex_for_single_word():
     assert pattern(r'\w+')('abc')
     assert not pattern(r'\w+')('abc abc')
+
+
+def test_string_validator_accepts_valid_values():
+    validator = string_validator('value', r'[a-z]+', min_len=2, max_len=4)
+    for value in ['ab', 'abcd']:
+        validator(value)
+
+
+def test_string_validator_matches_valid8_errors():
+    validator = string_validator('value', r'[a-z]+', min_len=2, max_len=4)
+    for value in ['a', 'abcde', 'AB', '']:
+        with pytest.raises(ValidationError) as expected:
+            validate('value', value, min_len=2, max_len=4, custom=pattern(r'[a-z]+'))
+        with pytest.raises(ValidationError) as actual:
+            validator(value)
+        assert str(actual.value) == str(expected.value)
+
+
+def test_string_validator_without_bounds():
+    validator = string_validator('value', r'\d*')
+    validator('')
+    validator('1' * 1000)
+    with pytest.raises(ValidationError):
+        validator('a')
+
+
+def test_string_validator_matches_and_mask():
+    validator = string_validator('value', r'[a-z]+', min_len=2, max_len=4)
+    assert validator.matches('abc')
+    assert not validator.matches('a')
+    assert validator.mask(['abc', 'a', 'ABC', 'abcd']) == [True, False, False, True]
+
+
+def test_string_validator_error():
+    validator = string_validator('value', r'[a-z]+', min_len=2)
+    assert validator.error('abc') is None
+    assert 'value' in validator.error('a')
@@ -0,0 +1,51 @@
+import importlib
+
+import pytest
+from typeguard import TypeCheckError
+
+from validation import typechecking
+
+
+@pytest.fixture
+def reload_typechecking(monkeypatch):
+    yield
+    monkeypatch.undo()
+    importlib.reload(typechecking)
+
+
+def test_enabled_by_default_in_debug(monkeypatch):
+    monkeypatch.delenv(typechecking.ENV_VARIABLE, raising=False)
+    assert typechecking.is_enabled() == __debug__
+
+
+def test_environment_variable_overrides_default(monkeypatch):
+    monkeypatch.setenv(typechecking.ENV_VARIABLE, '0')
+    assert not typechecking.is_enabled()
+    monkeypatch.setenv(typechecking.ENV_VARIABLE, '1')
+    assert typechecking.is_enabled() == __debug__
+
+
+def test_disabled_typechecked_returns_the_class_unchanged(monkeypatch, reload_typechecking):
+    monkeypatch.setenv(typechecking.ENV_VARIABLE, '0')
+    importlib.reload(typechecking)
+
+    class Foo:
+        def bar(self, value: int) -> int:
+            return value
+
+    assert typechecking.typechecked(Foo) is Foo
+    assert Foo().bar('not checked') == 'not checked'
+
+
+@pytest.mark.skipif(not __debug__, reason='typeguard does not check anything under python -O')
+def test_enabled_typechecked_checks_arguments(monkeypatch, reload_typechecking):
+    monkeypatch.setenv(typechecking.ENV_VARIABLE, '1')
+    importlib.reload(typechecking)
+
+    @typechecking.typechecked
+    class Foo:
+        def bar(self, value: int) -> int:
+            return value
+
+    with pytest.raises(TypeCheckError):
+        Foo().bar('checked')
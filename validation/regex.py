@@ -1,7 +1,11 @@
 import re
-from typing import Callable
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
 
-from typeguard import typechecked
+from valid8 import validate, ValidationError
+
+from validation.typechecking import typechecked
 
 
 @typechecked
@@ -13,3 +17,47 @@ def pattern(regex: str) -> Callable[[str], bool]:
 
     res.__name__ = f'pattern({regex})'
     return res
+
+
+@typechecked
+@dataclass
+class StringValidator:
+    name: str
+    regex: str
+    min_len: Optional[int] = None
+    max_len: Optional[int] = None
+    __fullmatch: Callable = field(init=False, repr=False, compare=False)
+    __custom: Callable[[str], bool] = field(init=False, repr=False, compare=False)
+    __low: int = field(init=False, repr=False, compare=False)
+    __high: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.__fullmatch = re.compile(self.regex).fullmatch
+        self.__custom = pattern(self.regex)
+        self.__low = 0 if self.min_len is None else self.min_len
+        self.__high = sys.maxsize if self.max_len is None else self.max_len
+
+    def __call__(self, value: str) -> None:
+        if not (self.__low <= len(value) <= self.__high and self.__fullmatch(value)):
+            bounds = {key: bound for key, bound in (('min_len', self.min_len), ('max_len', self.max_len))
+                      if bound is not None}
+            validate(self.name, value, custom=self.__custom, **bounds)
+
+    def matches(self, value: str) -> bool:
+        return self.__low <= len(value) <= self.__high and self.__fullmatch(value) is not None
+
+    def mask(self, values: List[str]) -> List[bool]:
+        low, high, fullmatch = self.__low, self.__high, self.__fullmatch
+        return [low <= len(value) <= high and fullmatch(value) is not None for value in values]
+
+    def error(self, value: str) -> Optional[str]:
+        try:
+            self(value)
+        except ValidationError as e:
+            return str(e)
+        return None
+
+
+def string_validator(name: str, regex: str, min_len: Optional[int] = None,
+                     max_len: Optional[int] = None) -> StringValidator:
+    return StringValidator(name, regex, min_len, max_len)
@@ -0,0 +1,17 @@
+import os
+
+ENV_VARIABLE = 'SHOPPING_LIST_TYPECHECK'
+
+
+def is_enabled() -> bool:
+    # typeguard strips its own checks under python -O, so the variable can only turn them off
+    if not __debug__:
+        return False
+    return os.environ.get(ENV_VARIABLE) not in ('', '0')
+
+
+if is_enabled():
+    from typeguard import typechecked
+else:
+    def typechecked(target):
+        return target